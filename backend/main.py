@@ -1,12 +1,22 @@
 import os
 import logging
+from contextlib import asynccontextmanager
+from anyio import to_thread
 from fastapi import FastAPI
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
+from threadpoolctl import threadpool_limits
 from src.api.papers import router as papers_router
+from src.services.data_loader import DataLoader
+from src.services.similarity import SimilarityService, numeric_threads
+from src.services.tsne_service import TSNEService
 
 # Configure logging
+log_level = os.getenv("LOG_LEVEL", "INFO").upper()
 logging.basicConfig(
-    level=logging.INFO,
+    level=log_level,
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
     handlers=[
         logging.StreamHandler(),
@@ -15,40 +25,90 @@ logging.basicConfig(
 
 logger = logging.getLogger(__name__)
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Paper endpoints doing similarity/clustering work are sync and run in
+    # the threadpool, so give it more room than anyio's default of 40
+    limiter = to_thread.current_default_thread_limiter()
+    limiter.total_tokens = int(os.getenv("THREADPOOL_SIZE", "100"))
+
+    # BLAS pools default to every core in every worker process; split the
+    # cores between uvicorn workers so similarity math in concurrent workers
+    # does not oversubscribe the machine. The BLAS limit is process-wide and
+    # restored when the app shuts down; OpenMP limits are per thread, so the
+    # services apply those around each fit instead.
+    with threadpool_limits(limits=numeric_threads(), user_api='blas'):
+        # Build the services once per process and share them through app.state
+        app.state.data_loader = DataLoader()
+        app.state.data_loader.preload()
+        app.state.similarity_service = SimilarityService(app.state.data_loader)
+        app.state.tsne_service = TSNEService(app.state.data_loader, app.state.similarity_service)
+
+        # The frontend requests t-SNE coordinates on page load, so compute (or load
+        # the on-disk cache) before serving instead of stalling the first request
+        coordinates = await run_in_threadpool(app.state.tsne_service.get_tsne_coordinates)
+        logger.info(f"Paper services initialized, {len(coordinates)} t-SNE coordinates warm")
+        yield
+
 app = FastAPI(
     title="MICCAI 2025 Papers Visualization API",
     description="API for exploring MICCAI 2025 conference papers through interactive graph visualization",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan
 )
 
-# Configure CORS - allow all origins in development, specific origins in production
-cors_origins = os.getenv("CORS_ORIGINS", "http://localhost:3000,http://localhost:3001,http://localhost:5173").split(",")
-# Clean up any whitespace
-cors_origins = [origin.strip() for origin in cors_origins if origin.strip()]
+# Configure CORS - local dev servers by default, specific origins in production.
+# The API is read-only, so only GET (and preflight OPTIONS) is allowed.
+CORS_ORIGINS = [
+    origin.strip()
+    for origin in os.getenv("CORS_ORIGINS", "http://localhost:3000,http://localhost:3001,http://localhost:5173").split(",")
+    if origin.strip()
+]
+CORS_METHODS = ["GET", "OPTIONS"]
+CORS_HEADERS = ["Content-Type", "If-None-Match", "Authorization"]
 
-logger.info(f"CORS origins configured: {cors_origins}")
+logger.debug(f"CORS origins configured: {CORS_ORIGINS}")
 
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=cors_origins,
+    allow_origins=CORS_ORIGINS,
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=CORS_METHODS,
+    allow_headers=CORS_HEADERS,
+    expose_headers=["X-Total-Count"],
 )
 
+# Compress large JSON payloads (graph data, t-SNE coordinates, stats)
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
 # Include API routers
 app.include_router(papers_router, prefix="/api")
 
 @app.get("/")
 async def root():
-    logger.info("Root endpoint accessed")
+    logger.debug("Root endpoint accessed")
     return {"message": "MICCAI 2025 Papers Visualization API"}
 
 @app.get("/health")
 async def health():
-    logger.info("Health check endpoint accessed")
+    logger.debug("Health check endpoint accessed")
     return {"status": "healthy"}
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    # uvloop + httptools come with uvicorn[standard]; pass the app as an
+    # import string so uvicorn can spawn worker processes. Every worker loads
+    # the papers, embeddings and t-SNE coordinates itself, so run one by
+    # default and scale up explicitly with WEB_CONCURRENCY
+    uvicorn.run(
+        "main:app",
+        host="0.0.0.0",
+        port=8000,
+        loop="uvloop",
+        http="httptools",
+        workers=int(os.getenv("WEB_CONCURRENCY", "1")),
+        access_log=False,
+        log_level=log_level.lower(),
+    )
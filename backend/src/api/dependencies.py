@@ -0,0 +1,19 @@
+from fastapi import Request
+from ..services.data_loader import DataLoader
+from ..services.similarity import SimilarityService
+from ..services.tsne_service import TSNEService
+
+
+def get_data_loader(request: Request) -> DataLoader:
+    """Shared DataLoader created in the app lifespan"""
+    return request.app.state.data_loader
+
+
+def get_similarity_service(request: Request) -> SimilarityService:
+    """Shared SimilarityService created in the app lifespan"""
+    return request.app.state.similarity_service
+
+
+def get_tsne_service(request: Request) -> TSNEService:
+    """Shared TSNEService created in the app lifespan"""
+    return request.app.state.tsne_service
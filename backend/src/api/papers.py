@@ -1,61 +1,130 @@
-from fastapi import APIRouter, HTTPException, Query
-from typing import List, Optional, Dict, Any
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import ORJSONResponse
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+from collections import Counter, OrderedDict
+from weakref import WeakKeyDictionary
+import hashlib
 import logging
+import threading
+import orjson
 from ..models.paper import Paper, PaperSimilarity, GraphData
 from ..services.data_loader import DataLoader
 from ..services.similarity import SimilarityService
 from ..services.tsne_service import TSNEService
+from .dependencies import get_data_loader, get_similarity_service, get_tsne_service
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/papers", tags=["papers"])
 
-# Initialize services
-data_loader = DataLoader()
-similarity_service = SimilarityService(data_loader)
-tsne_service = TSNEService(data_loader)
+# Serialized payloads for endpoints whose output only changes with the dataset,
+# stored as (etag, body) per endpoint name and arguments under the service that
+# produced them, so separate app instances never share payloads and a replaced
+# service (with its corpus and embeddings) is not kept alive by the cache
+_response_cache: "WeakKeyDictionary[Any, Dict[str, OrderedDict[Hashable, Tuple[str, bytes]]]]" = WeakKeyDictionary()
+_response_cache_lock = threading.Lock()
+
+# Most recently used payloads kept per service for endpoints with query arguments
+SEARCH_CACHE_SIZE = 1024
+GRAPH_CACHE_SIZE = 64
+
+
+def _cached_payload(owner: Any, name: str, build: Callable[[], Any], args: Hashable = (), maxsize: int = 1) -> Tuple[str, bytes]:
+    """(etag, body) for endpoint name called with args, built and serialized on a miss
+
+    Only the maxsize most recently used argument sets are kept per owner. The
+    ETag is weak because GZipMiddleware may serve the body compressed.
+    """
+    with _response_cache_lock:
+        payloads = _response_cache.setdefault(owner, {}).setdefault(name, OrderedDict())
+        cached = payloads.get(args)
+        if cached is not None:
+            payloads.move_to_end(args)
+            return cached
+
+    body = orjson.dumps(build(), option=orjson.OPT_SERIALIZE_NUMPY)
+    cached = (f'W/"{hashlib.sha256(body).hexdigest()}"', body)
+    with _response_cache_lock:
+        payloads[args] = cached
+        if len(payloads) > maxsize:
+            payloads.popitem(last=False)
+    return cached
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Whether an If-None-Match header matches etag, using weak comparison"""
+    if not if_none_match:
+        return False
+    tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return "*" in tags or etag.removeprefix("W/") in tags
+
+
+def _cached_json_response(request: Request, owner: Any, key: str, build: Callable[[], Any]) -> Response:
+    """Serve a cached JSON payload, answering 304 when the client's ETag matches"""
+    etag, body = _cached_payload(owner, key, build)
+    headers = {"ETag": etag, "Cache-Control": "public, max-age=3600"}
+    if _etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
 
 
 @router.get("/", response_model=List[Paper])
-async def get_papers(
+def get_papers(
     limit: int = Query(50, ge=1, le=1000),
-    offset: int = Query(0, ge=0)
+    offset: int = Query(0, ge=0),
+    data_loader: DataLoader = Depends(get_data_loader)
 ):
     """Get all papers with pagination"""
-    all_papers = data_loader.get_all_papers()
-    total = len(all_papers)
-
-    if offset >= total:
-        return []
-
-    return all_papers[offset:offset + limit]
+    # Papers are dumped once at load time; returning the response directly
+    # skips validating every page against response_model again
+    papers, total = data_loader.get_papers_slice(offset, limit, as_dicts=True)
+    return ORJSONResponse(content=papers, headers={"X-Total-Count": str(total)})
 
 
 @router.get("/search", response_model=List[Paper])
-async def search_papers(
+def search_papers(
     q: str = Query(..., min_length=1),
-    limit: int = Query(20, ge=1, le=100)
+    limit: int = Query(20, ge=1, le=100),
+    data_loader: DataLoader = Depends(get_data_loader)
 ):
     """Search papers by title, abstract, authors, or subject areas"""
-    results = data_loader.search_papers(q, limit)
-    return results
+    # Matching is case-insensitive, so queries differing only in case share an entry
+    query = q.lower()
+    _, body = _cached_payload(
+        data_loader,
+        "search",
+        lambda: [paper.model_dump() for paper in data_loader.search_papers(query, limit)],
+        args=(query, limit),
+        maxsize=SEARCH_CACHE_SIZE
+    )
+    return Response(content=body, media_type="application/json")
 
 
 @router.get("/tsne-coordinates")
-async def get_tsne_coordinates():
+def get_tsne_coordinates(
+    request: Request,
+    tsne_service: TSNEService = Depends(get_tsne_service)
+):
     """Get t-SNE coordinates for all papers"""
-    logger.info("t-SNE coordinates endpoint accessed")
+    logger.debug("t-SNE coordinates endpoint accessed")
     try:
-        coordinates = tsne_service.get_tsne_coordinates()
-        logger.info(f"Returning {len(coordinates)} t-SNE coordinates")
-        return {"coordinates": coordinates}
+        return _cached_json_response(
+            request,
+            tsne_service,
+            "tsne-coordinates",
+            lambda: {"coordinates": tsne_service.get_tsne_coordinates()}
+        )
     except Exception as e:
         logger.error(f"Error getting t-SNE coordinates: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Error getting t-SNE coordinates: {str(e)}")
 
 
 @router.get("/{paper_id}", response_model=Paper)
-async def get_paper(paper_id: str):
+async def get_paper(
+    paper_id: str,
+    data_loader: DataLoader = Depends(get_data_loader)
+):
     """Get a specific paper by ID"""
     paper = data_loader.get_paper_by_id(paper_id)
     if not paper:
@@ -64,9 +133,11 @@ async def get_paper(paper_id: str):
 
 
 @router.get("/{paper_id}/similar", response_model=List[PaperSimilarity])
-async def get_similar_papers(
+def get_similar_papers(
     paper_id: str,
-    limit: int = Query(10, ge=1, le=50)
+    limit: int = Query(10, ge=1, le=50),
+    data_loader: DataLoader = Depends(get_data_loader),
+    similarity_service: SimilarityService = Depends(get_similarity_service)
 ):
     """Get papers similar to the specified paper"""
     paper = data_loader.get_paper_by_id(paper_id)
@@ -78,77 +149,87 @@ async def get_similar_papers(
 
 
 @router.get("/graph/data", response_model=GraphData)
-async def get_graph_data(
+def get_graph_data(
     similarity_threshold: float = Query(0.7, ge=0.0, le=1.0),
     max_edges: int = Query(1000, ge=100, le=5000),
     sample_size: Optional[int] = Query(None, ge=50, le=500),
-    subject_areas: Optional[List[str]] = Query(None)
+    subject_areas: Optional[List[str]] = Query(None),
+    similarity_service: SimilarityService = Depends(get_similarity_service)
 ):
     """Get graph data for visualization with papers as nodes and similarities as edges"""
     try:
-        # For performance, we might want to sample papers for large datasets
+        # Sampled graphs are random, so only the deterministic ones are cached
         if sample_size:
-            # TODO: Implement sampling logic if needed for performance
-            pass
-
-        graph_data = similarity_service.generate_graph_data(
-            similarity_threshold=similarity_threshold,
-            max_edges=max_edges,
-            sample_size=sample_size,
-            subject_areas=subject_areas
+            graph_data = similarity_service.generate_graph_data(
+                similarity_threshold=similarity_threshold,
+                max_edges=max_edges,
+                sample_size=sample_size,
+                subject_areas=subject_areas
+            )
+            # Returning a response directly skips re-validating the model
+            return ORJSONResponse(content=graph_data.model_dump())
+
+        areas = tuple(sorted(set(subject_areas))) if subject_areas else None
+        _, body = _cached_payload(
+            similarity_service,
+            "graph-data",
+            lambda: similarity_service.generate_graph_data(
+                similarity_threshold=similarity_threshold,
+                max_edges=max_edges,
+                subject_areas=list(areas) if areas else None
+            ).model_dump(),
+            args=(similarity_threshold, max_edges, areas),
+            maxsize=GRAPH_CACHE_SIZE
         )
-        return graph_data
+        return Response(content=body, media_type="application/json")
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error generating graph data: {str(e)}")
 
 
 @router.get("/stats/summary")
-async def get_dataset_stats():
+def get_dataset_stats(
+    request: Request,
+    data_loader: DataLoader = Depends(get_data_loader)
+):
     """Get dataset statistics"""
     try:
-        index = data_loader.load_paper_index()
-        all_papers = data_loader.get_all_papers()
+        return _cached_json_response(
+            request, data_loader, "stats-summary", lambda: _compute_dataset_stats(data_loader)
+        )
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error getting dataset stats: {str(e)}")
 
-        # Calculate author statistics
-        all_authors = set()
-        subject_area_counts = {}
 
-        for paper in all_papers:
-            for author in paper.authors:
-                all_authors.add(author.name)
+def _compute_dataset_stats(data_loader: DataLoader) -> Dict[str, Any]:
+    index = data_loader.load_paper_index()
+    all_papers = data_loader.get_all_papers()
 
-            for area in paper.subject_areas:
-                subject_area_counts[area] = subject_area_counts.get(area, 0) + 1
+    all_authors = {author.name for paper in all_papers for author in paper.authors}
+    subject_area_counts = Counter(area for paper in all_papers for area in paper.subject_areas)
 
-        return {
-            "total_papers": len(all_papers),
-            "total_authors": len(all_authors),
-            "subject_areas": dict(sorted(subject_area_counts.items(), key=lambda x: x[1], reverse=True)),
-            "dataset_info": index.get("dataset_info", {})
-        }
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Error getting dataset stats: {str(e)}")
+    return {
+        "total_papers": len(all_papers),
+        "total_authors": len(all_authors),
+        "subject_areas": dict(subject_area_counts.most_common()),
+        "dataset_info": index.get("dataset_info", {})
+    }
 
 
 @router.get("/clusters/")
-async def get_paper_clusters(n_clusters: int = Query(10, ge=2, le=20)):
+def get_paper_clusters(
+    n_clusters: int = Query(10, ge=2, le=20),
+    data_loader: DataLoader = Depends(get_data_loader),
+    similarity_service: SimilarityService = Depends(get_similarity_service)
+):
     """Get paper clusters based on similarity"""
     try:
         clusters = similarity_service.get_paper_clusters(n_clusters)
 
         # Add paper details to each cluster
+        summaries = data_loader.get_paper_summaries()
         detailed_clusters = {}
         for cluster_id, paper_ids in clusters.items():
-            papers = []
-            for pid in paper_ids:
-                paper = data_loader.get_paper_by_id(pid)
-                if paper:
-                    papers.append({
-                        "id": paper.id,
-                        "title": paper.title,
-                        "authors": [a.name for a in paper.authors]
-                    })
-
+            papers = [summaries[pid] for pid in paper_ids if pid in summaries]
             detailed_clusters[cluster_id] = {
                 "papers": papers,
                 "size": len(papers)
@@ -160,9 +241,10 @@ async def get_paper_clusters(n_clusters: int = Query(10, ge=2, le=20)):
 
 
 @router.get("/clusters/data")
-async def get_clusters_data(
+def get_clusters_data(
     subject_areas: Optional[List[str]] = Query(None),
-    sample_size: Optional[int] = Query(None, ge=50, le=1000)
+    sample_size: Optional[int] = Query(None, ge=50, le=1000),
+    similarity_service: SimilarityService = Depends(get_similarity_service)
 ):
     """Get similarity-based clustering visualization data for all papers"""
     try:
@@ -170,15 +252,16 @@ async def get_clusters_data(
             subject_areas=subject_areas,
             sample_size=sample_size
         )
-        return clusters_data
+        return ORJSONResponse(content=clusters_data.model_dump())
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error generating clusters data: {str(e)}")
 
 
 @router.get("/network/data")
-async def get_network_data(
+def get_network_data(
     paper_id: str,
-    limit: int = Query(20, ge=5, le=50)
+    limit: int = Query(20, ge=5, le=50),
+    similarity_service: SimilarityService = Depends(get_similarity_service)
 ):
     """Get network data for a specific paper showing top similar papers"""
     try:
@@ -191,25 +274,27 @@ async def get_network_data(
 @router.get("/{paper_id}/similarity-network")
 async def get_similarity_network(
     paper_id: str,
-    top_k: int = Query(20, ge=5, le=50)
+    top_k: int = Query(20, ge=5, le=50),
+    data_loader: DataLoader = Depends(get_data_loader),
+    tsne_service: TSNEService = Depends(get_tsne_service)
 ):
     """Get similarity network data for a specific paper with t-SNE coordinates"""
-    try:
-        # Check if paper exists
-        paper = data_loader.get_paper_by_id(paper_id)
-        if not paper:
-            raise HTTPException(status_code=404, detail="Paper not found")
+    # Check if paper exists; this is a dict lookup, so only the build goes
+    # to the threadpool
+    if not data_loader.get_paper_by_id(paper_id):
+        raise HTTPException(status_code=404, detail="Paper not found")
 
-        network_data = tsne_service.get_similarity_network_data(paper_id, top_k)
-        return network_data
-    except HTTPException:
-        raise
+    try:
+        return await run_in_threadpool(tsne_service.get_similarity_network_data, paper_id, top_k)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error generating similarity network: {str(e)}")
 
 
 @router.get("/{paper_id}/highlight")
-async def highlight_paper(paper_id: str):
+async def highlight_paper(
+    paper_id: str,
+    data_loader: DataLoader = Depends(get_data_loader)
+):
     """Get paper data for highlighting in cluster view"""
     try:
         paper = data_loader.get_paper_by_id(paper_id)
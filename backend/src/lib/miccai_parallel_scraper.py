@@ -6,19 +6,21 @@ High-performance scraper that processes all MICCAI 2025 papers in parallel.
 Uses concurrent processing for faster data extraction while respecting rate limits.
 """
 
-import json
 import logging
 import re
+import threading
 import time
+from collections import Counter
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import Dict, List, Optional, Set, Tuple
 from urllib.parse import urljoin
-import threading
 
 import click
+import orjson
 import requests
 from bs4 import BeautifulSoup
+from lxml import etree, html as lxml_html
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
@@ -28,6 +30,157 @@ from .paper_parser import PaperParser, Paper, Author, ExternalLink
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# HEAD requests for PDF verification are tiny, so they get a wider pool than paper fetches
+PDF_VERIFY_WORKERS = 32
+
+# Patterns used on every paper, compiled once
+_PAPER_URL_RE = re.compile(r'/miccai-2025/(\d+-Paper(\d+))\.html')
+_PDF_RE = re.compile(r'paper/(\d+)_paper\.pdf')
+# [^@] keeps the gaps inside one BibTeX entry, so malformed entries can't backtrack across the item
+_CITATION_RE = re.compile(
+    r'@InProceedings\{([^}]+)\}[^@]*?author\s*=\s*\{([^}]+)\}[^@]*?title\s*=\s*\{([^}]+)\}',
+    re.IGNORECASE
+)
+_AUTHOR_TRIM_RE = re.compile(r'^[,;\s]+|[,;\s]+$')
+_TOPIC_TRIM_RE = re.compile(r'^[-\s]+|[-\s]+$')
+_TOPIC_SPLIT_RE = re.compile(r'\s*[|;,]\s*')
+_PIPE_SPLIT_RE = re.compile(r'\s*\|\s*')
+# Topic labels are alternated so the text is scanned once rather than once per label
+_TOPIC_RE = re.compile(
+    r'(?:Topic\(s?\)|Topics?|Subject(?:\s+Area)?s?|Keywords?|Categories?):\s*([^\n\r]+)',
+    re.IGNORECASE
+)
+_TOPIC_LABEL_RE = re.compile(r'Topic(?:\(s?\)|s)?:', re.IGNORECASE)
+_DETAILED_TOPIC_RE = re.compile(r'(?:Topic\(s?\)|Topics?):\s*([^\n\r]+)', re.IGNORECASE)
+_TOPIC_SECTION_RE = re.compile(
+    r'Topic\(s?\):\s*\n(.*?)(?=\n\s*Author\(s?\):|$)', re.IGNORECASE | re.DOTALL
+)
+_TOPIC_LINE_RE = re.compile(r'^\s*([^|\n]+?)\s*\|\s*$', re.MULTILINE)
+# Index page entries that are site navigation rather than papers
+_NAVIGATION_TITLE_RE = re.compile(
+    r'list of papers|browse by subject areas|author list|miccai 2025|proceedings|open access',
+    re.IGNORECASE
+)
+_NAVIGATION_KEYWORD_RE = re.compile(r'list|browse|proceedings', re.IGNORECASE)
+# A topic block is complete once the Author(s): label that follows it has arrived
+_TOPIC_BLOCK_END_RE = re.compile(r'Topic\(s?\):.*?\n\s*Author\(s?\):', re.IGNORECASE | re.DOTALL)
+
+DETAIL_CHUNK_SIZE = 8192
+_HEADING_TAGS = {'h1', 'h2', 'h3', 'h4', 'h5', 'h6'}
+
+
+def _response_encoding(response: requests.Response) -> str:
+    """Charset to decode a response with; without one requests assumes ISO-8859-1, but the site serves UTF-8"""
+    content_type = response.headers.get('Content-Type', '').lower()
+    return response.encoding if 'charset' in content_type else 'utf-8'
+
+
+class _RateLimiter:
+    """Spaces requests from all worker threads to at most a given rate."""
+
+    def __init__(self, requests_per_second: float):
+        self.interval = 1.0 / requests_per_second if requests_per_second > 0 else 0.0
+        self._lock = threading.Lock()
+        self._next_slot = time.monotonic()
+
+    def wait(self):
+        """Block until the caller's request slot comes up."""
+        if not self.interval:
+            return
+        with self._lock:
+            now = time.monotonic()
+            slot = max(self._next_slot, now)
+            self._next_slot = slot + self.interval
+        # Sleep outside the lock so other workers can claim later slots
+        if slot > now:
+            time.sleep(slot - now)
+
+
+class _DetailPageCollector:
+    """
+    lxml parser target collecting a paper page's text and abstract as it streams in.
+
+    Mirrors the BeautifulSoup extraction: text excludes script/style content, and the
+    abstract is the run of sibling <p> elements following an "Abstract" heading.
+    """
+
+    def __init__(self):
+        self.text_parts: List[str] = []
+        self.abstract: Optional[str] = None
+        self._depth = 0
+        self._skip_depth: Optional[int] = None
+        self._heading_depth: Optional[int] = None
+        self._heading_text: List[str] = []
+        self._awaiting_paragraph = False
+        self._paragraph_depth: Optional[int] = None
+        self._paragraph_text: Optional[List[str]] = None
+        self._abstract_parts: List[str] = []
+
+    @property
+    def text(self) -> str:
+        return ''.join(self.text_parts)
+
+    def start(self, tag, attrib):
+        self._depth += 1
+        if tag in ('script', 'style') and self._skip_depth is None:
+            self._skip_depth = self._depth
+        if self.abstract is not None:
+            return
+
+        if tag in _HEADING_TAGS:
+            if self._paragraph_depth == self._depth:
+                self._finish_abstract()
+            elif self._heading_depth is None and not self._awaiting_paragraph:
+                self._heading_depth = self._depth
+                self._heading_text = []
+        elif tag == 'p':
+            if self._awaiting_paragraph:
+                self._awaiting_paragraph = False
+                self._paragraph_depth = self._depth
+            if self._paragraph_depth == self._depth:
+                self._paragraph_text = []
+
+    def end(self, tag):
+        if self._paragraph_text is not None and self._paragraph_depth == self._depth:
+            text = ''.join(self._paragraph_text).strip()
+            if text and len(text) > 10:
+                self._abstract_parts.append(text)
+            self._paragraph_text = None
+        elif self._paragraph_depth is not None and self._depth < self._paragraph_depth:
+            # The element holding the abstract paragraphs has closed
+            self._finish_abstract()
+
+        if self._heading_depth == self._depth:
+            self._heading_depth = None
+            if 'abstract' in ''.join(self._heading_text).lower():
+                self._awaiting_paragraph = True
+
+        if self._skip_depth == self._depth:
+            self._skip_depth = None
+        self._depth -= 1
+
+    def data(self, data):
+        if self._skip_depth is not None:
+            return
+        self.text_parts.append(data)
+        if self._heading_depth is not None:
+            self._heading_text.append(data)
+        if self._paragraph_text is not None:
+            self._paragraph_text.append(data)
+
+    def close(self):
+        if self._paragraph_depth is not None:
+            self._finish_abstract()
+
+    def _finish_abstract(self):
+        abstract_text = '\n'.join(self._abstract_parts)
+        if self.abstract is None and len(abstract_text) > 50:
+            self.abstract = abstract_text
+        # Otherwise keep looking for a later Abstract heading
+        self._paragraph_depth = None
+        self._paragraph_text = None
+        self._abstract_parts = []
+
 
 class MICCAIParallelScraper:
     """High-performance parallel scraper for MICCAI dataset."""
@@ -42,47 +195,50 @@ class MICCAIParallelScraper:
         """
         self.max_workers = max_workers
         self.request_delay = request_delay
+
+        # Spread the per-worker delay into one shared rate, so requests are spaced
+        # evenly instead of each worker idling before every paper
+        self.rate_limiter = _RateLimiter(max_workers / request_delay if request_delay > 0 else 0)
         self.parser = PaperParser()
 
-        # Thread-safe counters
-        self.lock = threading.Lock()
+        # Progress counters, only updated from the thread collecting results
         self.processed_count = 0
         self.success_count = 0
         self.error_count = 0
 
-        # Session pool for parallel requests
-        self.session_pool = []
-        self._create_session_pool()
-
-    def _create_session_pool(self):
-        """Create a pool of HTTP sessions for parallel requests."""
-        for _ in range(self.max_workers):
-            session = requests.Session()
-
-            # Configure retry strategy
-            retry_strategy = Retry(
-                total=3,
-                backoff_factor=1,
-                status_forcelist=[429, 500, 502, 503, 504],
-            )
-
-            adapter = HTTPAdapter(max_retries=retry_strategy)
-            session.mount("http://", adapter)
-            session.mount("https://", adapter)
-
-            session.headers.update({
-                'User-Agent': 'MICCAI-Research-Scraper/1.0 (Academic Research)',
-                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-                'Accept-Language': 'en-US,en;q=0.9',
-                'Accept-Encoding': 'gzip, deflate',
-                'Connection': 'keep-alive',
-            })
-
-            self.session_pool.append(session)
-
-    def get_session(self, worker_id: int) -> requests.Session:
-        """Get session for specific worker."""
-        return self.session_pool[worker_id % len(self.session_pool)]
+        # One session shared by all workers so idle keep-alive connections
+        # to the MICCAI host can be reused by whichever worker needs one
+        self.session = self._create_session()
+
+    def _create_session(self) -> requests.Session:
+        """Create the HTTP session shared by the worker threads."""
+        session = requests.Session()
+
+        # Configure retry strategy
+        retry_strategy = Retry(
+            total=3,
+            backoff_factor=1,
+            status_forcelist=[429, 500, 502, 503, 504],
+        )
+
+        # Size the connection pool for every worker plus the PDF verification pass
+        adapter = HTTPAdapter(
+            pool_connections=self.max_workers,
+            pool_maxsize=max(self.max_workers * 2, PDF_VERIFY_WORKERS),
+            max_retries=retry_strategy
+        )
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+
+        session.headers.update({
+            'User-Agent': 'MICCAI-Research-Scraper/1.0 (Academic Research)',
+            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+            'Accept-Language': 'en-US,en;q=0.9',
+            'Accept-Encoding': 'gzip, deflate',
+            'Connection': 'keep-alive',
+        })
+
+        return session
 
     def extract_all_papers_metadata(self) -> List[Dict]:
         """Extract all paper metadata from the main MICCAI page."""
@@ -90,16 +246,21 @@ class MICCAIParallelScraper:
         logger.info(f"Fetching main page to extract paper metadata: {url}")
 
         try:
-            session = self.get_session(0)
-            response = session.get(url, timeout=30)
-            response.raise_for_status()
-
-            soup = BeautifulSoup(response.content, 'html.parser')
+            # The index page is large and only needs simple element lookups, so
+            # walk the lxml tree directly rather than wrapping it in BeautifulSoup.
+            # lxml reads the body straight off the socket, building the tree while
+            # the download is still in progress instead of buffering it first.
+            with self.session.get(url, stream=True, timeout=30) as response:
+                response.raise_for_status()
+                response.raw.decode_content = True
+                parser = lxml_html.HTMLParser(encoding=_response_encoding(response))
+                tree = lxml_html.parse(response.raw, parser=parser).getroot()
             papers_metadata = []
 
-            # Find all list items that contain papers
-            paper_items = soup.find_all('li')
-            logger.info(f"Found {len(paper_items)} list items to examine")
+            # Find all list items that contain papers. Items without a <b> title
+            # can't be papers, so let XPath drop them before any Python-side work.
+            paper_items = tree.xpath('//li[.//b]')
+            logger.info(f"Found {len(paper_items)} titled list items to examine")
 
             for item in paper_items:
                 try:
@@ -112,14 +273,8 @@ class MICCAIParallelScraper:
 
             # Filter out navigation items and keep only actual papers
             valid_papers = []
-            navigation_titles = {
-                'list of papers', 'browse by subject areas', 'author list',
-                'miccai 2025', 'proceedings', 'open access'
-            }
-
             for paper in papers_metadata:
-                title_lower = paper['title'].lower()
-                if not any(nav in title_lower for nav in navigation_titles):
+                if not _NAVIGATION_TITLE_RE.search(paper['title']):
                     if len(paper['title']) > 20:  # Reasonable paper title length
                         valid_papers.append(paper)
 
@@ -133,11 +288,11 @@ class MICCAIParallelScraper:
     def _extract_paper_metadata(self, item) -> Optional[Dict]:
         """Extract metadata from a single list item."""
         # Look for paper title in <b> tags
-        title_elem = item.find('b')
-        if not title_elem:
+        title_elem = item.find('.//b')
+        if title_elem is None:
             return None
 
-        title = title_elem.get_text().strip()
+        title = title_elem.text_content().strip()
         if len(title) < 5:  # Skip very short titles
             return None
 
@@ -148,52 +303,54 @@ class MICCAIParallelScraper:
             'paper_id': None,
             'pdf_url': None,
             'topics': [],  # Add topics extraction
-            'raw_html': str(item),
+            'paper_slug': None,
             'citation_data': {}
         }
 
         # Extract authors from author links
-        author_links = item.find_all('a', href=lambda x: x and 'tags#' in x)
+        author_links = item.xpath('.//a[contains(@href, "tags#")]')
         authors = []
+        seen_authors = set()
         for link in author_links:
-            author_name = link.get_text().strip()
-            if author_name and author_name not in authors:
-                # Clean up author names
-                author_name = re.sub(r'^[,;\s]+|[,;\s]+$', '', author_name)
-                if author_name:
-                    authors.append(author_name)
+            # Clean up author names
+            author_name = _AUTHOR_TRIM_RE.sub('', link.text_content().strip())
+            if author_name and author_name not in seen_authors:
+                seen_authors.add(author_name)
+                authors.append(author_name)
 
         paper_meta['authors'] = authors
 
         # Extract topics from the item text
-        item_text = item.get_text()
+        item_text = item.text_content()
         topics = self._extract_topics_from_text(item_text)
         paper_meta['topics'] = topics
 
         # Extract paper ID from the correct URL pattern and HTML content
-        content_text = item.get_text()
-        item_html = str(item)
-
-        # Look for the correct paper URL pattern: /miccai-2025/####-Paper####.html
-        paper_url_matches = re.findall(r'/miccai-2025/\d+-Paper(\d+)\.html', item_html)
-        if paper_url_matches:
-            paper_meta['paper_id'] = paper_url_matches[0]
+        content_text = item_text
+
+        # Look for the correct paper URL pattern: /miccai-2025/####-Paper####.html.
+        # The slug is kept so the detail page URL doesn't have to be rediscovered later.
+        paper_url_match = None
+        for href in item.xpath('.//@href'):
+            paper_url_match = _PAPER_URL_RE.search(href)
+            if paper_url_match:
+                break
+
+        if paper_url_match:
+            paper_meta['paper_slug'] = paper_url_match.group(1)
+            paper_meta['paper_id'] = paper_url_match.group(2)
             # The PDF URL follows the pattern: paper/{id}_paper.pdf
-            paper_meta['pdf_url'] = f"https://papers.miccai.org/miccai-2025/paper/{paper_url_matches[0]}_paper.pdf"
+            paper_meta['pdf_url'] = f"https://papers.miccai.org/miccai-2025/paper/{paper_meta['paper_id']}_paper.pdf"
         else:
             # Fallback: look for PDF patterns in content
-            pdf_matches = re.findall(r'paper/(\d+)_paper\.pdf', content_text)
+            pdf_matches = _PDF_RE.findall(content_text)
             if pdf_matches:
                 paper_meta['paper_id'] = pdf_matches[0]
                 paper_meta['pdf_url'] = f"https://papers.miccai.org/miccai-2025/paper/{pdf_matches[0]}_paper.pdf"
 
         # Extract citation information if available
         if '@InProceedings{' in content_text:
-            citation_match = re.search(
-                r'@InProceedings\{([^}]+)\}.*?author\s*=\s*\{([^}]+)\}.*?title\s*=\s*\{([^}]+)\}',
-                content_text,
-                re.DOTALL | re.IGNORECASE
-            )
+            citation_match = _CITATION_RE.search(content_text)
             if citation_match:
                 paper_meta['citation_data'] = {
                     'citation_key': citation_match.group(1).strip(),
@@ -206,27 +363,19 @@ class MICCAIParallelScraper:
     def _extract_topics_from_text(self, text: str) -> List[str]:
         """Extract topics from item text content."""
         topics = []
+        seen_topics = set()
 
         # Look for patterns like "Topic(s): Brain | Lung | CT / X-Ray | MRI | Machine Learning"
-        topic_patterns = [
-            r'Topic\(s?\):\s*([^\n\r]+)',
-            r'Topics?:\s*([^\n\r]+)',
-            r'Subject(?:\s+Area)?s?:\s*([^\n\r]+)',
-            r'Keywords?:\s*([^\n\r]+)',
-            r'Categories?:\s*([^\n\r]+)'
-        ]
-
-        for pattern in topic_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE | re.MULTILINE)
-            for match in matches:
-                # Split by common delimiters: |, ;, comma
-                topic_parts = re.split(r'\s*[|;,]\s*', match.strip())
-                for topic in topic_parts:
-                    topic = topic.strip()
-                    # Clean up the topic
-                    topic = re.sub(r'^[-\s]+|[-\s]+$', '', topic)  # Remove leading/trailing dashes and spaces
-                    if topic and len(topic) > 1 and topic not in topics:
-                        topics.append(topic)
+        for match in _TOPIC_RE.findall(text):
+            # Split by common delimiters: |, ;, comma
+            topic_parts = _TOPIC_SPLIT_RE.split(match.strip())
+            for topic in topic_parts:
+                topic = topic.strip()
+                # Clean up the topic
+                topic = _TOPIC_TRIM_RE.sub('', topic)  # Remove leading/trailing dashes and spaces
+                if topic and len(topic) > 1 and topic not in seen_topics:
+                    seen_topics.add(topic)
+                    topics.append(topic)
 
         return topics
 
@@ -238,9 +387,8 @@ class MICCAIParallelScraper:
         if len(title) < 10:
             return False
 
-        # Skip navigation items
-        nav_keywords = ['list', 'browse', 'author list', 'proceedings']
-        if any(keyword in title.lower() for keyword in nav_keywords):
+        # Skip navigation items ('author list' is covered by 'list')
+        if _NAVIGATION_KEYWORD_RE.search(title):
             return False
 
         # Must have reasonable content
@@ -249,15 +397,36 @@ class MICCAIParallelScraper:
 
         return True
 
-    def verify_pdf_url(self, pdf_url: str, worker_id: int) -> bool:
+    def verify_pdf_url(self, pdf_url: str) -> bool:
         """Verify if PDF URL is accessible."""
         try:
-            session = self.get_session(worker_id)
-            response = session.head(pdf_url, timeout=5)
+            self.rate_limiter.wait()
+            response = self.session.head(pdf_url, timeout=5)
             return response.status_code == 200
         except:
             return False
 
+    def verify_pdf_links(self, papers: List[Paper]) -> None:
+        """Verify all PDF links in one concurrent pass and drop unreachable ones."""
+        pdf_urls = list({
+            link.url for paper in papers for link in paper.external_links if link.type == 'pdf'
+        })
+        if not pdf_urls:
+            return
+
+        logger.info(f"Verifying {len(pdf_urls)} PDF links...")
+        with ThreadPoolExecutor(max_workers=PDF_VERIFY_WORKERS) as executor:
+            results = executor.map(self.verify_pdf_url, pdf_urls)
+            accessible = dict(zip(pdf_urls, results))
+
+        for paper in papers:
+            paper.external_links = [
+                link for link in paper.external_links
+                if link.type != 'pdf' or accessible[link.url]
+            ]
+
+        logger.info(f"{sum(accessible.values())}/{len(pdf_urls)} PDF links are accessible")
+
     def fetch_paper_details(self, paper_meta: Dict, worker_id: int) -> Dict:
         """Fetch detailed information from individual paper page."""
         try:
@@ -265,14 +434,11 @@ class MICCAIParallelScraper:
             if not paper_id:
                 return paper_meta
 
-            # Try to reconstruct the paper URL from the raw HTML
+            # Use the page slug captured from the index page when there is one
             paper_url = None
-            raw_html = paper_meta.get('raw_html', '')
-
-            # Look for the full URL pattern in the raw HTML
-            url_matches = re.findall(r'/miccai-2025/(\d+-Paper\d+)\.html', raw_html)
-            if url_matches:
-                paper_url = f"https://papers.miccai.org/miccai-2025/{url_matches[0]}.html"
+            paper_slug = paper_meta.get('paper_slug')
+            if paper_slug:
+                paper_url = f"https://papers.miccai.org/miccai-2025/{paper_slug}.html"
             else:
                 # Fallback: try common patterns for paper 0392
                 if paper_id == '0392':
@@ -285,20 +451,18 @@ class MICCAIParallelScraper:
                 logger.warning(f"Could not construct URL for paper {paper_id}")
                 return paper_meta
 
-            session = self.get_session(worker_id)
-            response = session.get(paper_url, timeout=30)
-            response.raise_for_status()
-
-            soup = BeautifulSoup(response.content, 'html.parser')
+            self.rate_limiter.wait()
+            with self.session.get(paper_url, stream=True, timeout=30) as response:
+                response.raise_for_status()
+                page_text, abstract = self._parse_detail_page(response)
 
             # Extract detailed topics from the individual paper page
-            detailed_topics = self._extract_detailed_topics(soup)
+            detailed_topics = self._extract_detailed_topics(page_text)
             if detailed_topics:
                 paper_meta['topics'] = detailed_topics
                 logger.debug(f"Extracted detailed topics for paper {paper_id}: {detailed_topics}")
 
             # Extract abstract if available
-            abstract = self._extract_abstract(soup)
             if abstract:
                 paper_meta['abstract'] = abstract
 
@@ -308,12 +472,43 @@ class MICCAIParallelScraper:
             logger.warning(f"Worker {worker_id}: Failed to fetch details for paper {paper_meta.get('paper_id', 'unknown')}: {e}")
             return paper_meta
 
-    def _extract_detailed_topics(self, soup: BeautifulSoup) -> List[str]:
-        """Extract detailed topics from individual paper page."""
+    def _parse_detail_page(self, response: requests.Response) -> Tuple[str, Optional[str]]:
+        """Stream a paper page through lxml, returning its text and abstract."""
+        collector = _DetailPageCollector()
+        parser = etree.HTMLParser(target=collector, encoding=_response_encoding(response))
+        chunks = []
+        done = False
+
+        # Parsing overlaps the download and stops once the topic block and the
+        # abstract are both in hand. The rest of the body is still drained so the
+        # connection can go back to the pool.
+        for chunk in response.iter_content(chunk_size=DETAIL_CHUNK_SIZE):
+            if done:
+                continue
+            chunks.append(chunk)
+            parser.feed(chunk)
+            done = collector.abstract is not None and bool(_TOPIC_BLOCK_END_RE.search(collector.text))
+        if not done:
+            parser.close()
+
+        abstract = collector.abstract
+        if abstract is None:
+            # No heading-delimited abstract, so look for abstract containers in the full page
+            abstract = self._extract_abstract(BeautifulSoup(b''.join(chunks), 'lxml'))
+
+        return collector.text, abstract
+
+    def _extract_detailed_topics(self, page_text: str) -> List[str]:
+        """Extract detailed topics from individual paper page text."""
         topics = []
+        seen_topics = set()
 
-        # Look for the Topic(s): pattern in the page text
-        page_text = soup.get_text()
+        # Every topic format starts with a Topic label, so skip straight to the
+        # first one instead of running each pattern over the whole page
+        label_match = _TOPIC_LABEL_RE.search(page_text)
+        if not label_match:
+            return topics
+        start = label_match.start()
 
         # First try to find topics in a multi-line format like:
         # Topic(s):
@@ -329,34 +524,29 @@ class MICCAIParallelScraper:
         #        |
 
         # Look for the Topic(s): section and extract everything until the Author(s): section
-        topic_section_match = re.search(r'Topic\(s?\):\s*\n(.*?)(?=\n\s*Author\(s?\):|$)', page_text, re.IGNORECASE | re.DOTALL)
+        topic_section_match = _TOPIC_SECTION_RE.search(page_text, start)
         if topic_section_match:
             topic_section = topic_section_match.group(1)
             # Extract individual topics from the section
-            topic_lines = re.findall(r'^\s*([^|\n]+?)\s*\|\s*$', topic_section, re.MULTILINE)
+            topic_lines = _TOPIC_LINE_RE.findall(topic_section)
             for topic in topic_lines:
                 topic = topic.strip()
-                if topic and len(topic) > 1 and topic not in topics:
+                if topic and len(topic) > 1 and topic not in seen_topics:
+                    seen_topics.add(topic)
                     topics.append(topic)
 
         # Fallback: try single-line format
         if not topics:
-            topic_patterns = [
-                r'Topic\(s?\):\s*([^\n\r]+)',
-                r'Topics?:\s*([^\n\r]+)',
-            ]
-
-            for pattern in topic_patterns:
-                matches = re.findall(pattern, page_text, re.IGNORECASE | re.MULTILINE)
-                for match in matches:
-                    # Split by pipe separator and clean up
-                    topic_parts = re.split(r'\s*\|\s*', match.strip())
-                    for topic in topic_parts:
-                        topic = topic.strip()
-                        # Clean up the topic - remove trailing pipes and extra spaces
-                        topic = re.sub(r'^[-\s]+|[-\s]+$', '', topic)
-                        if topic and len(topic) > 1 and topic not in topics:
-                            topics.append(topic)
+            for match in _DETAILED_TOPIC_RE.findall(page_text, start):
+                # Split by pipe separator and clean up
+                topic_parts = _PIPE_SPLIT_RE.split(match.strip())
+                for topic in topic_parts:
+                    topic = topic.strip()
+                    # Clean up the topic - remove trailing pipes and extra spaces
+                    topic = _TOPIC_TRIM_RE.sub('', topic)
+                    if topic and len(topic) > 1 and topic not in seen_topics:
+                        seen_topics.add(topic)
+                        topics.append(topic)
 
         return topics
 
@@ -418,9 +608,6 @@ class MICCAIParallelScraper:
     def process_paper_parallel(self, paper_meta: Dict, worker_id: int) -> Optional[Paper]:
         """Process a single paper in parallel worker thread."""
         try:
-            # Add small delay to respect rate limits
-            time.sleep(self.request_delay * (worker_id % 3))  # Stagger requests
-
             # Fetch detailed information from individual paper page
             paper_meta = self.fetch_paper_details(paper_meta, worker_id)
 
@@ -433,16 +620,15 @@ class MICCAIParallelScraper:
             if not authors:
                 authors = [Author(name='Unknown Author')]
 
-            # Create external links with PDF verification
+            # PDF URLs are derived from the paper ID, so include the link
+            # optimistically; verify_pdf_links checks them all in one pass later
             external_links = []
             if paper_meta.get('pdf_url'):
-                pdf_accessible = self.verify_pdf_url(paper_meta['pdf_url'], worker_id)
-                if pdf_accessible:
-                    external_links.append(ExternalLink(
-                        type='pdf',
-                        url=paper_meta['pdf_url'],
-                        description='Full paper PDF'
-                    ))
+                external_links.append(ExternalLink(
+                    type='pdf',
+                    url=paper_meta['pdf_url'],
+                    description='Full paper PDF'
+                ))
 
             # Use detailed abstract if available, otherwise generate one
             abstract_text = paper_meta.get('abstract')
@@ -485,21 +671,12 @@ class MICCAIParallelScraper:
                 subject_areas=subject_areas,  # Use extracted topics
                 external_links=external_links,
                 publication_date='2025-10-01',
-                raw_data_source=json.dumps(paper_meta.get('citation_data', {}))
+                raw_data_source=orjson.dumps(paper_meta.get('citation_data', {})).decode()
             )
 
-            # Update counters (thread-safe)
-            with self.lock:
-                self.processed_count += 1
-                self.success_count += 1
-
             return paper
 
         except Exception as e:
-            with self.lock:
-                self.processed_count += 1
-                self.error_count += 1
-
             logger.warning(f"Worker {worker_id}: Failed to process paper '{paper_meta.get('title', 'unknown')}': {e}")
             return None
 
@@ -532,10 +709,14 @@ class MICCAIParallelScraper:
 
             # Collect results as they complete
             for future in as_completed(future_to_meta):
+                self.processed_count += 1
                 try:
                     paper = future.result(timeout=30)
                     if paper:
                         papers.append(paper)
+                        self.success_count += 1
+                    else:
+                        self.error_count += 1
 
                     # Progress reporting
                     if self.processed_count % 50 == 0:
@@ -545,8 +726,9 @@ class MICCAIParallelScraper:
                 except Exception as e:
                     paper_meta = future_to_meta[future]
                     logger.error(f"Future failed for paper '{paper_meta.get('title', 'unknown')}': {e}")
-                    with self.lock:
-                        self.error_count += 1
+                    self.error_count += 1
+
+        self.verify_pdf_links(papers)
 
         # Final statistics
         logger.info(f"✅ Parallel processing complete:")
@@ -564,11 +746,16 @@ class MICCAIParallelScraper:
 
         logger.info(f"Saving {len(papers)} papers to {output_path}")
 
-        # Save individual paper files
-        for paper in papers:
+        # Save individual paper files. Thousands of small writes are dominated by
+        # per-file open/close overhead, so spread them over the worker threads.
+        def save_paper(paper: Paper) -> None:
             paper_file = output_path / f"{paper.id}.json"
-            with open(paper_file, 'w', encoding='utf-8') as f:
-                json.dump(paper.model_dump(), f, indent=2, ensure_ascii=False)
+            # Serialize straight from the model in pydantic-core rather than dumping to a dict first
+            paper_file.write_text(paper.model_dump_json(indent=2), encoding='utf-8')
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            # Consume the iterator so write errors are raised here
+            list(executor.map(save_paper, papers))
 
         # Generate comprehensive statistics
         stats = self._generate_dataset_stats(papers)
@@ -598,13 +785,11 @@ class MICCAIParallelScraper:
             ]
         }
 
-        with open(index_file, 'w', encoding='utf-8') as f:
-            json.dump(index_data, f, indent=2, ensure_ascii=False)
+        index_file.write_bytes(orjson.dumps(index_data, option=orjson.OPT_INDENT_2))
 
         # Save detailed statistics
         stats_file = output_path / "dataset_stats.json"
-        with open(stats_file, 'w', encoding='utf-8') as f:
-            json.dump(stats, f, indent=2, ensure_ascii=False)
+        stats_file.write_bytes(orjson.dumps(stats, option=orjson.OPT_INDENT_2))
 
         logger.info(f"✅ Saved all papers, index, and statistics to {output_path}")
         return stats
@@ -614,29 +799,25 @@ class MICCAIParallelScraper:
         if not papers:
             return {}
 
-        # Basic counts
+        # Gather everything in one pass over the papers
         total_papers = len(papers)
-        papers_with_pdf = len([p for p in papers if any(link.type == 'pdf' for link in p.external_links)])
+        papers_with_pdf = 0
+        author_counts = []
+        unique_authors = set()
+        title_lengths = []
+        abstract_lengths = []
+        subject_counts = Counter()
 
-        # Author statistics
-        all_authors = []
         for paper in papers:
-            all_authors.extend([author.name for author in paper.authors])
+            if any(link.type == 'pdf' for link in paper.external_links):
+                papers_with_pdf += 1
+            author_counts.append(len(paper.authors))
+            unique_authors.update(author.name for author in paper.authors)
+            title_lengths.append(len(paper.title))
+            abstract_lengths.append(len(paper.abstract))
+            subject_counts.update(paper.subject_areas)
 
-        unique_authors = len(set(all_authors))
-        avg_authors_per_paper = len(all_authors) / total_papers
-
-        # Title and abstract length statistics
-        title_lengths = [len(paper.title) for paper in papers]
-        abstract_lengths = [len(paper.abstract) for paper in papers]
-
-        # Subject area statistics
-        all_subjects = []
-        for paper in papers:
-            all_subjects.extend(paper.subject_areas)
-        subject_counts = {}
-        for subject in all_subjects:
-            subject_counts[subject] = subject_counts.get(subject, 0) + 1
+        total_author_mentions = sum(author_counts)
 
         return {
             'total_papers': total_papers,
@@ -644,11 +825,11 @@ class MICCAIParallelScraper:
             'pdf_availability_rate': (papers_with_pdf / total_papers) * 100,
 
             'author_stats': {
-                'total_author_mentions': len(all_authors),
-                'unique_authors': unique_authors,
-                'avg_authors_per_paper': round(avg_authors_per_paper, 2),
-                'max_authors': max([len(p.authors) for p in papers]),
-                'min_authors': min([len(p.authors) for p in papers])
+                'total_author_mentions': total_author_mentions,
+                'unique_authors': len(unique_authors),
+                'avg_authors_per_paper': round(total_author_mentions / total_papers, 2),
+                'max_authors': max(author_counts),
+                'min_authors': min(author_counts)
             },
 
             'content_stats': {
@@ -660,7 +841,7 @@ class MICCAIParallelScraper:
                 'min_abstract_length': min(abstract_lengths)
             },
 
-            'subject_distribution': dict(sorted(subject_counts.items(), key=lambda x: x[1], reverse=True)),
+            'subject_distribution': dict(subject_counts.most_common()),
 
             'processing_stats': {
                 'success_rate': (self.success_count / max(self.processed_count, 1)) * 100,
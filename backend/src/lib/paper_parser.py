@@ -6,15 +6,20 @@ Parses raw paper HTML/data from MICCAI and converts it into structured Paper ent
 Provides both programmatic API and CLI interface.
 """
 
+import hashlib
 import json
 import logging
 import re
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
-from typing import Dict, List, Optional, Union
+from typing import Dict, FrozenSet, Iterator, List, Optional, Tuple, Union
 from urllib.parse import urljoin, urlparse
 
 import click
-from bs4 import BeautifulSoup
+import orjson
+from bs4 import BeautifulSoup, Tag
 from pydantic import BaseModel, Field, field_validator
 
 
@@ -22,6 +27,132 @@ from pydantic import BaseModel, Field, field_validator
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Patterns applied per paper/author, compiled once
+# Comma, semicolon, "and" or pipe separated author lists, split in one pass.
+# A pipe also takes a following " and ", which the old per-delimiter passes
+# split on before the pipe.
+_AUTHOR_SPLIT_RE = re.compile(r',\s*|;\s*|\s+and\s+|\s*\|(?:\s+and\s+|\s*)', re.IGNORECASE)
+_EMAIL_RE = re.compile(r'\b[\w.-]+@[\w.-]+\.\w+\b')
+# Emails and parenthesized notes are both dropped from author names
+_AUTHOR_STRIP_RE = re.compile(r'\b[\w.-]+@[\w.-]+\.\w+\b|\s*\([^)]*\)\s*')
+_WHITESPACE_RE = re.compile(r'\s+')
+_SUBJECT_SPLIT_RE = re.compile(r'[,;|]')
+_ID_INVALID_RE = re.compile(r'[^a-zA-Z0-9-_]')
+_DASH_RUN_RE = re.compile(r'-+')
+# Byte-level equivalent of _ID_INVALID_RE for ASCII IDs: invalid bytes map to '-'
+_ID_BYTE_TABLE = bytes(
+    c if chr(c).isascii() and (chr(c).isalnum() or chr(c) in '-_') else ord('-')
+    for c in range(256)
+)
+_URL_PART_RE = re.compile(r'^[a-zA-Z0-9-_]+$')
+_TITLE_CLEAN_RE = re.compile(r'[^a-zA-Z0-9\s]')
+# Link triage: code hosts, and hosts that never count as external websites
+_CODE_HOST_RE = re.compile(r'github\.com|gitlab\.com|bitbucket\.org')
+_LOCAL_HOST_RE = re.compile(r'miccai\.org|localhost|127\.0\.0\.1')
+
+# Simple tag/.class/#id selectors tried in priority order. The first match of
+# each is found in one walk over the document (see _first_matches).
+_TITLE_SELECTORS = ('h1', '.title', '#title', 'title')
+_ABSTRACT_SELECTORS = ('.abstract', '#abstract', '.summary', '.paper-abstract')
+_AUTHOR_SELECTORS = ('.authors', '.author', '#authors', '.paper-authors')
+_MATCH_SELECTORS = frozenset(_TITLE_SELECTORS + _ABSTRACT_SELECTORS + _AUTHOR_SELECTORS)
+_SUBJECT_SELECTORS = (
+    '.subject-areas', '.keywords', '.tags', '.categories',
+    '#subject-areas', '#keywords', '#tags'
+)
+_SUBJECT_MATCH_SELECTORS = frozenset(_SUBJECT_SELECTORS)
+
+
+def _first_matches(
+    soup: BeautifulSoup, selectors: FrozenSet[str] = _MATCH_SELECTORS
+) -> Dict[str, Tag]:
+    """First element in document order for each simple tag/.class/#id selector.
+
+    Equivalent to calling select_one per selector, but walks the tree once.
+    """
+    tags = {s for s in selectors if s[0] not in '.#'}
+    matches: Dict[str, Tag] = {}
+    for elem in soup.descendants:
+        name = elem.name
+        if name is None:
+            continue
+
+        if name in tags and name not in matches:
+            matches[name] = elem
+
+        elem_id = elem.get('id')
+        if elem_id:
+            key = f'#{elem_id}'
+            if key in selectors and key not in matches:
+                matches[key] = elem
+
+        for class_name in elem.get('class', ()):
+            key = f'.{class_name}'
+            if key in selectors and key not in matches:
+                matches[key] = elem
+
+        if len(matches) == len(selectors):
+            break
+
+    return matches
+
+
+def _short_hash(text: str) -> str:
+    """Short stable hash for fallback IDs; unlike hash(), it is the same across runs."""
+    return hashlib.blake2b(text.encode('utf-8'), digest_size=3).hexdigest()
+
+
+# Keywords used to infer subject areas from a paper's title and abstract
+_MEDICAL_IMAGING_TERMS = ('medical', 'clinical', 'radiology', 'mri', 'ct', 'ultrasound')
+_DEEP_LEARNING_TERMS = ('deep learning', 'neural network', 'cnn', 'transformer')
+_MACHINE_LEARNING_TERMS = ('machine learning', 'classification', 'regression')
+_COMPUTER_VISION_TERMS = ('segmentation', 'detection', 'recognition', 'computer vision')
+_IMAGE_PROCESSING_TERMS = ('image processing', 'filtering', 'enhancement')
+
+
+def _iter_json_array(f, chunk_size: int = 1 << 16):
+    """
+    Yield the items of a top-level JSON array one at a time.
+
+    Reads the file in chunks so only the item being decoded is held in memory,
+    rather than the whole raw corpus. Non-array documents are loaded whole and
+    iterated as before.
+    """
+    decoder = json.JSONDecoder()
+    buffer = f.read(chunk_size).lstrip()
+    if not buffer.startswith('['):
+        yield from json.loads(buffer + f.read())
+        return
+
+    pos = 1
+    eof = False
+    while True:
+        # Skip whitespace and separators between items
+        while pos < len(buffer) and buffer[pos] in ' \t\r\n,':
+            pos += 1
+        if pos < len(buffer) and buffer[pos] == ']':
+            return
+
+        try:
+            item, end = decoder.raw_decode(buffer, pos)
+            # A number can decode from a prefix of itself ("12" of "12.5"), so an
+            # item only counts once the delimiter after it has been read
+            complete = eof or (end < len(buffer) and buffer[end] in ' \t\r\n,]')
+        except json.JSONDecodeError:
+            if eof:
+                raise
+            complete = False
+
+        if complete:
+            yield item
+            pos = end
+            continue
+
+        chunk = f.read(chunk_size)
+        eof = not chunk
+        buffer = buffer[pos:] + chunk
+        pos = 0
+
 
 class Author(BaseModel):
     """Author entity with validation."""
@@ -74,10 +205,17 @@ class Paper(BaseModel):
     @field_validator('id')
     @classmethod
     def validate_id(cls, v: str) -> str:
-        # Generate clean ID from title or URL
-        clean_id = re.sub(r'[^a-zA-Z0-9-_]', '-', v.strip().lower())
-        clean_id = re.sub(r'-+', '-', clean_id).strip('-')
-        return clean_id or f"paper-{hash(v) % 10000:04d}"
+        # Generate clean ID from title or URL. ASCII input (the usual case) goes
+        # through a byte lookup table instead of the regex engine.
+        clean_id = v.strip().lower()
+        if clean_id.isascii():
+            clean_id = clean_id.encode('ascii').translate(_ID_BYTE_TABLE).decode('ascii')
+        else:
+            clean_id = _ID_INVALID_RE.sub('-', clean_id)
+        if '--' in clean_id:
+            clean_id = _DASH_RUN_RE.sub('-', clean_id)
+        clean_id = clean_id.strip('-')
+        return clean_id or f"paper-{_short_hash(v)}"
 
     @field_validator('title')
     @classmethod
@@ -93,7 +231,7 @@ class Paper(BaseModel):
     @classmethod
     def validate_subject_areas(cls, v: List[str]) -> List[str]:
         # Clean and deduplicate subject areas
-        cleaned = [area.strip() for area in v if area.strip()]
+        cleaned = [area for area in map(str.strip, v) if area]
         return list(dict.fromkeys(cleaned))  # Remove duplicates while preserving order
 
 
@@ -108,82 +246,51 @@ class PaperParser:
 
     def parse_authors(self, authors_text: str) -> List[Author]:
         """Parse author string into Author objects."""
-        if not authors_text or not authors_text.strip():
-            return [Author(name="Unknown Author")]
-
-        # Split by common delimiters
-        author_patterns = [
-            r',\s*',          # comma separated
-            r';\s*',          # semicolon separated
-            r'\s+and\s+',     # "and" separated
-            r'\s*\|\s*',      # pipe separated
-        ]
+        return [Author(**fields) for fields in self._author_fields(authors_text)]
 
-        authors_list = [authors_text]
-        for pattern in author_patterns:
-            new_list = []
-            for author_text in authors_list:
-                new_list.extend(re.split(pattern, author_text, flags=re.IGNORECASE))
-            authors_list = new_list
-
-        authors = []
-        for author_text in authors_list:
-            author_text = author_text.strip()
-            if not author_text:
-                continue
-
-            # Extract email if present
-            email_match = re.search(r'\b[\w.-]+@[\w.-]+\.\w+\b', author_text)
-            email = email_match.group() if email_match else None
-
-            # Extract name (remove email and common patterns)
-            name = re.sub(r'\b[\w.-]+@[\w.-]+\.\w+\b', '', author_text).strip()
-            name = re.sub(r'\s*\([^)]*\)\s*', '', name)  # Remove parentheses
-            name = re.sub(r'\s+', ' ', name).strip()
-
-            if name:
-                authors.append(Author(name=name, email=email))
+    @staticmethod
+    def _author_fields(authors_text: str) -> List[Dict[str, Optional[str]]]:
+        """Unvalidated author fields, left for the enclosing Paper to validate."""
+        if not authors_text or not authors_text.strip():
+            return [{'name': "Unknown Author"}]
 
-        return authors if authors else [Author(name="Unknown Author")]
+        authors = [{'name': name, 'email': email} for name, email in _split_authors(authors_text)]
+        return authors if authors else [{'name': "Unknown Author"}]
 
     def extract_subject_areas(self, soup: BeautifulSoup, title: str, abstract: str) -> List[str]:
         """Extract subject areas from HTML or infer from content."""
         subject_areas = []
 
         # Try to find explicit subject areas in HTML
-        subject_selectors = [
-            '.subject-areas', '.keywords', '.tags', '.categories',
-            '#subject-areas', '#keywords', '#tags'
-        ]
-
-        for selector in subject_selectors:
-            elem = soup.select_one(selector)
+        first_matches = _first_matches(soup, _SUBJECT_MATCH_SELECTORS)
+        for selector in _SUBJECT_SELECTORS:
+            elem = first_matches.get(selector)
             if elem:
                 text = elem.get_text()
                 # Split by common delimiters
-                areas = re.split(r'[,;|]', text)
-                subject_areas.extend([area.strip() for area in areas if area.strip()])
+                areas = _SUBJECT_SPLIT_RE.split(text)
+                subject_areas.extend(area for area in map(str.strip, areas) if area)
 
         # If no explicit areas found, infer from title and abstract
         if not subject_areas:
             content = f"{title} {abstract}".lower()
 
             # Medical imaging keywords
-            if any(term in content for term in ['medical', 'clinical', 'radiology', 'mri', 'ct', 'ultrasound']):
+            if any(term in content for term in _MEDICAL_IMAGING_TERMS):
                 subject_areas.append("Medical Imaging")
 
             # AI/ML keywords
-            if any(term in content for term in ['deep learning', 'neural network', 'cnn', 'transformer']):
+            if any(term in content for term in _DEEP_LEARNING_TERMS):
                 subject_areas.append("Deep Learning")
-            elif any(term in content for term in ['machine learning', 'classification', 'regression']):
+            elif any(term in content for term in _MACHINE_LEARNING_TERMS):
                 subject_areas.append("Machine Learning")
 
             # Computer vision keywords
-            if any(term in content for term in ['segmentation', 'detection', 'recognition', 'computer vision']):
+            if any(term in content for term in _COMPUTER_VISION_TERMS):
                 subject_areas.append("Computer Vision")
 
             # Image processing keywords
-            if any(term in content for term in ['image processing', 'filtering', 'enhancement']):
+            if any(term in content for term in _IMAGE_PROCESSING_TERMS):
                 subject_areas.append("Image Processing")
 
         # Fallback to default if still empty
@@ -191,21 +298,25 @@ class PaperParser:
             subject_areas = ["Medical Imaging"]
 
         # Clean and deduplicate
-        cleaned_areas = []
-        for area in subject_areas:
-            area = area.strip().title()
-            if area and area not in cleaned_areas:
-                cleaned_areas.append(area)
-
-        return cleaned_areas
+        cleaned_areas = (area.strip().title() for area in subject_areas)
+        return list(dict.fromkeys(area for area in cleaned_areas if area))
 
     def extract_external_links(self, soup: BeautifulSoup, base_url: str) -> List[ExternalLink]:
         """Extract external links from HTML."""
-        links = []
+        return [ExternalLink(**fields) for fields in self._external_link_fields(soup, base_url)]
 
-        for link in soup.find_all('a', href=True):
+    def _external_link_fields(self, soup: BeautifulSoup, base_url: str) -> List[Dict[str, str]]:
+        """Unvalidated external link fields, left for the enclosing Paper to validate."""
+        links: Dict[str, Dict[str, str]] = {}
+
+        # A plain walk over the already-built tree beats find_all's attribute matching
+        for link in soup.descendants:
+            if link.name != 'a' or link.get('href') is None:
+                continue
             href = str(link['href'])  # type: ignore
-            text = link.get_text().strip().lower()
+            # Walk the link's subtree once; the text serves both matching and descriptions
+            link_text = link.get_text().strip()
+            text = link_text.lower()
 
             if not href or not isinstance(href, str):
                 continue
@@ -214,53 +325,37 @@ class PaperParser:
             full_url = urljoin(base_url, href)
 
             # Categorize links
-            if any(domain in href for domain in ['github.com', 'gitlab.com', 'bitbucket.org']):
-                links.append(ExternalLink(
-                    type='github',
-                    url=full_url,
-                    description=link.get_text().strip() or 'Source code'
-                ))
+            if _CODE_HOST_RE.search(href):
+                link_type, default_description = 'github', 'Source code'
             elif href.endswith('.pdf'):
-                links.append(ExternalLink(
-                    type='pdf',
-                    url=full_url,
-                    description=link.get_text().strip() or 'PDF download'
-                ))
-            elif any(term in text for term in ['dataset', 'data']):
-                links.append(ExternalLink(
-                    type='dataset',
-                    url=full_url,
-                    description=link.get_text().strip() or 'Dataset'
-                ))
-            elif href.startswith(('http://', 'https://')) and not any(
-                domain in href for domain in ['miccai.org', 'localhost', '127.0.0.1']
-            ):
-                links.append(ExternalLink(
-                    type='website',
-                    url=full_url,
-                    description=link.get_text().strip() or 'External website'
-                ))
-
-        # Remove duplicates
-        seen_urls = set()
-        unique_links = []
-        for link in links:
-            if link.url not in seen_urls:
-                seen_urls.add(link.url)
-                unique_links.append(link)
-
-        return unique_links
+                link_type, default_description = 'pdf', 'PDF download'
+            elif 'data' in text:
+                link_type, default_description = 'dataset', 'Dataset'
+            elif href.startswith(('http://', 'https://')) and not _LOCAL_HOST_RE.search(href):
+                link_type, default_description = 'website', 'External website'
+            else:
+                continue
+
+            # Remove duplicates: the first link seen for a URL wins, in insertion order.
+            # URLs are keyed as ExternalLink will store them, i.e. stripped.
+            links.setdefault(full_url.strip(), {
+                'type': link_type,
+                'url': full_url,
+                'description': link_text or default_description
+            })
+
+        return list(links.values())
 
     def parse_paper_from_html(self, html_content: str, source_url: str) -> Optional[Paper]:
         """Parse a paper from raw HTML content."""
         try:
-            soup = BeautifulSoup(html_content, 'html.parser')
+            soup = BeautifulSoup(html_content, 'lxml')
+            first_matches = _first_matches(soup)
 
             # Extract title
             title = None
-            title_selectors = ['h1', '.title', '#title', 'title']
-            for selector in title_selectors:
-                elem = soup.select_one(selector)
+            for selector in _TITLE_SELECTORS:
+                elem = first_matches.get(selector)
                 if elem:
                     title = elem.get_text().strip()
                     if title and title.lower() != 'miccai 2025':  # Skip generic titles
@@ -297,11 +392,10 @@ class PaperParser:
 
             # Fallback: look for abstract containers
             if not abstract:
-                abstract_selectors = ['.abstract', '#abstract', '.summary', '.paper-abstract']
-                for selector in abstract_selectors:
+                for selector in _ABSTRACT_SELECTORS:
                     try:
                         # Try to get all paragraph elements within the container
-                        container = soup.select_one(selector)
+                        container = first_matches.get(selector)
                         if container:
                             # Look for paragraphs within the container
                             paragraphs = container.find_all('p')
@@ -340,20 +434,21 @@ class PaperParser:
 
             # Extract authors
             authors_text = ""
-            author_selectors = ['.authors', '.author', '#authors', '.paper-authors']
-            for selector in author_selectors:
-                elem = soup.select_one(selector)
+            for selector in _AUTHOR_SELECTORS:
+                elem = first_matches.get(selector)
                 if elem:
                     authors_text = elem.get_text().strip()
                     break
 
-            authors = self.parse_authors(authors_text)
+            # Authors and links stay plain dicts so that constructing the Paper
+            # validates them in a single pass instead of one model at a time
+            authors = self._author_fields(authors_text)
 
             # Extract subject areas
             subject_areas = self.extract_subject_areas(soup, title, abstract)
 
             # Extract external links
-            external_links = self.extract_external_links(soup, source_url)
+            external_links = self._external_link_fields(soup, source_url)
 
             # Generate paper ID
             paper_id = self._generate_paper_id(title, source_url)
@@ -380,35 +475,29 @@ class PaperParser:
         # Try to extract ID from URL first
         url_parts = urlparse(url).path.split('/')
         for part in reversed(url_parts):
-            if part and re.match(r'^[a-zA-Z0-9-_]+$', part):
+            if part and _URL_PART_RE.match(part):
                 return f"paper-{part}"
 
         # Generate from title
-        clean_title = re.sub(r'[^a-zA-Z0-9\s]', '', title.lower())
+        clean_title = _TITLE_CLEAN_RE.sub('', title.lower())
         words = clean_title.split()[:5]  # Take first 5 words
         paper_id = '-'.join(words)
 
-        return paper_id or f"paper-{abs(hash(url)) % 10000:04d}"
+        return paper_id or f"paper-{_short_hash(url)}"
 
     def parse_papers_from_json(self, json_file_path: str) -> List[Paper]:
         """Parse papers from raw JSON data file."""
         papers = []
 
         try:
-            with open(json_file_path, 'r', encoding='utf-8') as f:
-                raw_papers = json.load(f)
-
-            for raw_paper in raw_papers:
-                if not isinstance(raw_paper, dict):
-                    continue
-
-                html_content = raw_paper.get('html_content')
-                source_url = raw_paper.get('url') or raw_paper.get('source_url')
-
-                if html_content and source_url:
-                    paper = self.parse_paper_from_html(html_content, source_url)
-                    if paper:
-                        papers.append(paper)
+            # Parsing is pure CPU work, so fan it out over processes. Raw papers are
+            # streamed and handed over in bounded batches to keep memory flat.
+            with open(json_file_path, 'r', encoding='utf-8') as f, ProcessPoolExecutor() as executor:
+                sources = self._iter_html_sources(_iter_json_array(f))
+                while batch := list(islice(sources, PARSE_BATCH_SIZE)):
+                    for paper in executor.map(_parse_html_source, batch, chunksize=16):
+                        if paper:
+                            papers.append(paper)
 
         except Exception as e:
             logger.error(f"Error parsing papers from {json_file_path}: {e}")
@@ -416,28 +505,98 @@ class PaperParser:
         logger.info(f"Successfully parsed {len(papers)} papers from {json_file_path}")
         return papers
 
-    def save_parsed_papers(self, papers: List[Paper], output_path: str) -> None:
-        """Save parsed papers to JSON file."""
+    @staticmethod
+    def _iter_html_sources(raw_papers) -> Iterator[Tuple[str, str]]:
+        """Yield (html_content, source_url) for each raw paper that has both."""
+        for raw_paper in raw_papers:
+            if not isinstance(raw_paper, dict):
+                continue
+
+            html_content = raw_paper.get('html_content')
+            source_url = raw_paper.get('url') or raw_paper.get('source_url')
+
+            if html_content and source_url:
+                yield html_content, source_url
+
+    def save_parsed_papers(self, papers: List[Paper], output_path: str, ndjson: bool = False) -> None:
+        """Save parsed papers to a JSON file, or JSON Lines (one paper per line) if ndjson."""
         output_file = Path(output_path)
         output_file.parent.mkdir(parents=True, exist_ok=True)
 
+        if ndjson:
+            # Stream one paper at a time so memory doesn't grow with the corpus
+            with open(output_file, 'wb') as f:
+                for paper in papers:
+                    f.write(orjson.dumps(paper.model_dump(mode='json')))
+                    f.write(b'\n')
+            logger.info(f"Saved {len(papers)} parsed papers to {output_file}")
+            return
+
         # Convert to dict for JSON serialization
-        papers_dict = [paper.model_dump() for paper in papers]
+        papers_dict = [paper.model_dump(mode='json') for paper in papers]
 
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(papers_dict, f, indent=2, ensure_ascii=False)
+        output_file.write_bytes(orjson.dumps(papers_dict, option=orjson.OPT_INDENT_2))
 
         logger.info(f"Saved {len(papers)} parsed papers to {output_file}")
 
 
+# Raw papers handed to the process pool at a time
+PARSE_BATCH_SIZE = 256
+
+_worker_parser: Optional[PaperParser] = None
+
+
+def _parse_html_source(source: Tuple[str, str]) -> Optional[Paper]:
+    """Process pool entry point: parse one (html_content, source_url) pair."""
+    global _worker_parser
+    if _worker_parser is None:
+        _worker_parser = PaperParser()
+    return _worker_parser.parse_paper_from_html(*source)
+
+
+@lru_cache(maxsize=8192)
+def _split_authors(authors_text: str) -> Tuple[Tuple[str, Optional[str]], ...]:
+    """Split an author string into (name, email) pairs.
+
+    Memoized because the same author lists recur across papers; plain tuples are
+    cached rather than Author models so no mutable instance is shared.
+    """
+    # Split by common delimiters
+    pairs = []
+    for author_text in _AUTHOR_SPLIT_RE.split(authors_text):
+        author_text = author_text.strip()
+        if not author_text:
+            continue
+
+        # Extract email if present. Both patterns need an '@' or '(' to match,
+        # so the common plain-name case skips the regex engine entirely.
+        email = None
+        name = author_text
+        has_email = '@' in author_text
+        if has_email:
+            email_match = _EMAIL_RE.search(author_text)
+            email = email_match.group() if email_match else None
+
+        # Extract name (remove email and parentheses)
+        if has_email or '(' in author_text:
+            name = _AUTHOR_STRIP_RE.sub('', author_text)
+        name = _WHITESPACE_RE.sub(' ', name).strip()
+
+        if name:
+            pairs.append((name, email))
+
+    return tuple(pairs)
+
+
 # CLI Interface
 @click.command()
 @click.option('--input', '-i', required=True,
               help='Input JSON file with raw paper data')
 @click.option('--output', '-o', default='data/parsed_papers.json',
               help='Output file for parsed papers')
+@click.option('--ndjson', is_flag=True, help='Write JSON Lines, one paper per line')
 @click.option('--verbose', '-v', is_flag=True, help='Enable verbose logging')
-def main(input: str, output: str, verbose: bool):
+def main(input: str, output: str, ndjson: bool, verbose: bool):
     """
     Paper Parser CLI
 
@@ -454,7 +613,7 @@ def main(input: str, output: str, verbose: bool):
     try:
         papers = parser.parse_papers_from_json(input)
         if papers:
-            parser.save_parsed_papers(papers, output)
+            parser.save_parsed_papers(papers, output, ndjson=ndjson)
             click.echo(f"✅ Successfully parsed {len(papers)} papers")
             click.echo(f"📄 Data saved to: {output}")
         else:
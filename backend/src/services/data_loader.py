@@ -1,9 +1,39 @@
-import json
+import hashlib
+import logging
+import os
+import pickle
+import re
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
+import orjson
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Callable, Dict, List, Optional, Set, Tuple
 from ..models.paper import Paper
 
+logger = logging.getLogger(__name__)
+
+# Concurrent reads when loading every paper file at once
+READ_WORKERS = 32
+
+# Word tokens indexed for search_papers; shorter query words skip the index
+_TOKEN_RE = re.compile(r'\w+')
+MIN_INDEXED_TOKEN_LENGTH = 3
+TOKEN_MATCH_CACHE_SIZE = 4096
+
+
+def _atomic_write(path: Path, write: Callable) -> None:
+    """Write a file through a temporary sibling renamed into place, so readers never see it half-written"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            write(f)
+        os.replace(tmp_name, path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+
 
 class DataLoader:
     def __init__(self, data_dir: str = "src/data"):
@@ -13,13 +43,68 @@ class DataLoader:
         self._papers_cache: Dict[str, Paper] = {}
         self._embeddings_cache: Dict[str, np.ndarray] = {}
         self._paper_index: Optional[Dict] = None
+        self._all_papers: Optional[List[Paper]] = None
+        self._paper_summaries: Optional[Dict[str, Dict]] = None
+        self._paper_dicts: Optional[List[Dict]] = None
+        self._search_fields: Optional[List[Tuple[str, str, List[str], List[str]]]] = None
+        self._token_rows: Dict[str, Set[int]] = {}
+        self._token_match_cache: Dict[str, Set[int]] = {}
+        self.snapshot_file = self.data_dir / "cache" / "papers.pkl"
+        self.embeddings_snapshot_dir = self.data_dir / "cache"
+
+    def preload(self) -> None:
+        """Hydrate the index and all papers up front, using the pickle snapshot when fresh"""
+        if self._all_papers is not None:
+            return
+
+        snapshot = self._load_snapshot()
+        if snapshot is not None:
+            self._paper_index = snapshot["index"]
+            self._all_papers = snapshot["papers"]
+            self._papers_cache.update({paper.id: paper for paper in self._all_papers})
+            logger.info(f"Loaded {len(self._all_papers)} papers from snapshot {self.snapshot_file}")
+            return
+
+        self._save_snapshot(self.load_paper_index(), self.get_all_papers())
+
+    def _newest_paper_mtime(self) -> float:
+        """Latest modification time of the index and the individual paper files"""
+        with os.scandir(self.papers_dir) as entries:
+            return max(
+                (entry.stat().st_mtime for entry in entries if entry.name.endswith(".json")),
+                default=0.0
+            )
+
+    def _load_snapshot(self) -> Optional[Dict]:
+        """Load the pickled papers if the snapshot is newer than the index and every paper file"""
+        try:
+            if self.snapshot_file.stat().st_mtime < self._newest_paper_mtime():
+                return None
+            with open(self.snapshot_file, 'rb') as f:
+                return pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable papers snapshot {self.snapshot_file}: {e}")
+            return None
+
+    def _save_snapshot(self, index: Dict, papers: List[Paper]) -> None:
+        """Pickle the parsed index and papers so later startups skip JSON parsing"""
+        try:
+            snapshot = {"index": index, "papers": papers}
+            _atomic_write(
+                self.snapshot_file,
+                lambda f: pickle.dump(snapshot, f, protocol=pickle.HIGHEST_PROTOCOL)
+            )
+            logger.info(f"Saved papers snapshot to {self.snapshot_file}")
+        except Exception as e:
+            logger.warning(f"Could not save papers snapshot: {e}")
 
     def load_paper_index(self) -> Dict:
         """Load the main paper index with all paper IDs and metadata"""
         if self._paper_index is None:
             index_path = self.papers_dir / "index.json"
-            with open(index_path, 'r', encoding='utf-8') as f:
-                self._paper_index = json.load(f)
+            self._paper_index = orjson.loads(index_path.read_bytes())
         return self._paper_index or {}
 
     def get_paper_by_id(self, paper_id: str) -> Optional[Paper]:
@@ -27,42 +112,96 @@ class DataLoader:
         if paper_id in self._papers_cache:
             return self._papers_cache[paper_id]
 
-        paper_path = self.papers_dir / f"{paper_id}.json"
-        if not paper_path.exists():
+        # Once every indexed paper is loaded, an unknown ID is not in the dataset;
+        # answer from memory instead of probing the disk on every lookup
+        if self._all_papers is not None:
             return None
 
-        with open(paper_path, 'r', encoding='utf-8') as f:
-            paper_data = json.load(f)
+        content = self._read_paper_file(paper_id)
+        if content is None:
+            return None
 
-        paper = Paper(**paper_data)
+        # Validating straight from the JSON bytes skips building an intermediate dict
+        paper = Paper.model_validate_json(content)
         self._papers_cache[paper_id] = paper
         return paper
 
     def get_all_papers(self) -> List[Paper]:
-        """Load all papers"""
+        """Load all papers (the list is built once and shared between callers)"""
+        if self._all_papers is not None:
+            return self._all_papers
+
         index = self.load_paper_index()
-        papers = []
 
         # The index contains paper objects, not just IDs
-        for paper_data in index.get("papers", []):
-            if isinstance(paper_data, dict) and "id" in paper_data:
-                paper = self.get_paper_by_id(paper_data["id"])
-                if paper:
-                    papers.append(paper)
+        paper_ids = [
+            paper_data["id"] for paper_data in index.get("papers", [])
+            if isinstance(paper_data, dict) and "id" in paper_data
+        ]
+
+        # Read the uncached files concurrently so the disk reads overlap
+        # instead of running one after another
+        to_read = [pid for pid in paper_ids if pid not in self._papers_cache]
+        with ThreadPoolExecutor(max_workers=READ_WORKERS) as executor:
+            contents = list(executor.map(self._read_paper_file, to_read))
+
+        for paper_id, content in zip(to_read, contents):
+            if content is not None:
+                self._papers_cache[paper_id] = Paper.model_validate_json(content)
 
+        papers = [self._papers_cache[pid] for pid in paper_ids if pid in self._papers_cache]
+        self._all_papers = papers
         return papers
 
+    def _read_paper_file(self, paper_id: str) -> Optional[bytes]:
+        """Read a raw paper JSON file, or None if it does not exist"""
+        try:
+            return (self.papers_dir / f"{paper_id}.json").read_bytes()
+        except FileNotFoundError:
+            return None
+
+    def get_all_paper_dicts(self) -> List[Dict]:
+        """All papers as plain dicts, dumped once so responses can skip the models"""
+        if self._paper_dicts is None:
+            self._paper_dicts = [paper.model_dump() for paper in self.get_all_papers()]
+        return self._paper_dicts
+
+    def get_papers_slice(self, offset: int, limit: int, as_dicts: bool = False) -> Tuple[List, int]:
+        """Return one page of papers together with the total paper count"""
+        all_papers = self.get_all_paper_dicts() if as_dicts else self.get_all_papers()
+        return all_papers[offset:offset + limit], len(all_papers)
+
+    def get_paper_summaries(self) -> Dict[str, Dict]:
+        """Map paper ID to a lightweight {id, title, authors} summary"""
+        if self._paper_summaries is None:
+            self._paper_summaries = {
+                paper.id: {
+                    "id": paper.id,
+                    "title": paper.title,
+                    "authors": [a.name for a in paper.authors]
+                }
+                for paper in self.get_all_papers()
+            }
+        return self._paper_summaries
+
     def get_embedding_by_id(self, paper_id: str) -> Optional[np.ndarray]:
         """Load paper embedding by ID"""
         if paper_id in self._embeddings_cache:
             return self._embeddings_cache[paper_id]
 
-        embedding_path = self.embeddings_dir / f"{paper_id}_embedding.npz"
-        if not embedding_path.exists():
-            return None
+        # Raw .npy embeddings load without decompression; older ones are .npz.
+        # Per-paper files are read into memory rather than memory-mapped, since
+        # every cached memmap would hold a file descriptor open
+        embedding_path = self.embeddings_dir / f"{paper_id}_embedding.npy"
+        if embedding_path.exists():
+            embedding = np.load(embedding_path).astype(np.float32, copy=False)
+        else:
+            embedding_path = self.embeddings_dir / f"{paper_id}_embedding.npz"
+            if not embedding_path.exists():
+                return None
 
-        with np.load(embedding_path) as data:
-            embedding = data['embedding']
+            with np.load(embedding_path) as data:
+                embedding = np.ascontiguousarray(data['embedding'], dtype=np.float32)
 
         self._embeddings_cache[paper_id] = embedding
         return embedding
@@ -82,17 +221,140 @@ class DataLoader:
 
         return embeddings
 
+    def get_embedding_matrix(self) -> Tuple[List[str], np.ndarray]:
+        """IDs of papers with an embedding and their embeddings as float32 rows, cached on disk"""
+        signature = self._embeddings_signature()
+        snapshot = self._load_embeddings_snapshot(signature)
+        if snapshot is not None:
+            return snapshot
+
+        all_embeddings = self.get_all_embeddings()
+        paper_ids = list(all_embeddings.keys())
+        matrix = np.array([all_embeddings[pid] for pid in paper_ids], dtype=np.float32)
+        if paper_ids:
+            self._save_embeddings_snapshot(signature, paper_ids, matrix)
+        return paper_ids, matrix
+
+    def _embeddings_signature(self) -> str:
+        """Hash of the index and every embedding file's name, size and mtime
+
+        Embedding files are rewritten in place when papers are re-embedded,
+        which leaves the directory's own mtime untouched, so each file counts.
+        File contents are not read, since that is the work the snapshot saves;
+        an edit that preserves both a file's size and its mtime goes unnoticed.
+        """
+        digest = hashlib.blake2b(digest_size=8)
+        index_stat = (self.papers_dir / "index.json").stat()
+        digest.update(f"{index_stat.st_mtime_ns}:{index_stat.st_size}".encode())
+        try:
+            entries = sorted(os.scandir(self.embeddings_dir), key=lambda entry: entry.name)
+        except FileNotFoundError:
+            entries = []
+        for entry in entries:
+            if entry.name.endswith(("_embedding.npy", "_embedding.npz")):
+                stat = entry.stat()
+                digest.update(f"{entry.name}:{stat.st_mtime_ns}:{stat.st_size}\n".encode())
+        return digest.hexdigest()
+
+    def _embeddings_snapshot_paths(self, signature: str) -> Tuple[Path, Path]:
+        """Matrix and ID files of the embeddings snapshot for a signature"""
+        return (
+            self.embeddings_snapshot_dir / f"embeddings_{signature}.npy",
+            self.embeddings_snapshot_dir / f"embeddings_{signature}_ids.npy",
+        )
+
+    def _load_embeddings_snapshot(self, signature: str) -> Optional[Tuple[List[str], np.ndarray]]:
+        """Memory-map the stacked embeddings saved for the current embedding files, if any"""
+        matrix_file, ids_file = self._embeddings_snapshot_paths(signature)
+        try:
+            paper_ids = np.load(ids_file).tolist()
+            matrix = np.load(matrix_file, mmap_mode='r')
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable embeddings snapshot {matrix_file}: {e}")
+            return None
+        if matrix.shape[0] != len(paper_ids):
+            logger.warning(f"Ignoring embeddings snapshot {matrix_file} with mismatched IDs")
+            return None
+        return paper_ids, matrix
+
+    def _save_embeddings_snapshot(self, signature: str, paper_ids: List[str], matrix: np.ndarray) -> None:
+        """Save the stacked embeddings so later startups skip reading every embedding file"""
+        matrix_file, ids_file = self._embeddings_snapshot_paths(signature)
+        try:
+            # Each file is renamed into place whole; the loader needs both
+            _atomic_write(matrix_file, lambda f: np.save(f, matrix))
+            _atomic_write(ids_file, lambda f: np.save(f, np.array(paper_ids)))
+            for old_file in self.embeddings_snapshot_dir.glob("embeddings_*.npy"):
+                if old_file not in (matrix_file, ids_file):
+                    old_file.unlink(missing_ok=True)
+            logger.info(f"Saved embeddings snapshot to {matrix_file}")
+        except Exception as e:
+            logger.warning(f"Could not save embeddings snapshot: {e}")
+
+    def _build_search_index(self) -> None:
+        """Lowercase each paper's searchable fields once and index their word tokens"""
+        search_fields = []
+        token_rows: Dict[str, Set[int]] = {}
+        for row, paper in enumerate(self.get_all_papers()):
+            fields = (
+                paper.title.lower(),
+                paper.abstract.lower(),
+                [area.lower() for area in paper.subject_areas],
+                [author.name.lower() for author in paper.authors]
+            )
+            search_fields.append(fields)
+            for text in (fields[0], fields[1], *fields[2], *fields[3]):
+                for token in _TOKEN_RE.findall(text):
+                    token_rows.setdefault(token, set()).add(row)
+
+        self._search_fields = search_fields
+        self._token_rows = token_rows
+
+    def _rows_containing_token(self, token: str) -> Set[int]:
+        """Rows of papers with an indexed word containing token, memoized per token"""
+        rows = self._token_match_cache.get(token)
+        if rows is None:
+            rows = set().union(*(
+                token_rows for word, token_rows in self._token_rows.items() if token in word
+            ))
+            if len(self._token_match_cache) >= TOKEN_MATCH_CACHE_SIZE:
+                self._token_match_cache.clear()
+            self._token_match_cache[token] = rows
+        return rows
+
     def search_papers(self, query: str, limit: int = 20) -> List[Paper]:
         """Simple text search in paper titles and abstracts"""
         all_papers = self.get_all_papers()
+        if self._search_fields is None:
+            self._build_search_index()
         query_lower = query.lower()
 
+        # A field containing the query contains every word of it inside one of
+        # its own words, so the token index narrows the candidates before the
+        # exact substring checks below
+        rows: Optional[Set[int]] = None
+        for token in set(_TOKEN_RE.findall(query_lower)):
+            # Very short words occur almost everywhere and would not narrow anything
+            if len(token) < MIN_INDEXED_TOKEN_LENGTH:
+                continue
+            token_matches = self._rows_containing_token(token)
+            rows = token_matches if rows is None else rows & token_matches
+            if not rows:
+                return []
+
+        candidates = range(len(all_papers)) if rows is None else sorted(rows)
+
         matching_papers = []
-        for paper in all_papers:
-            if (query_lower in paper.title.lower() or
-                query_lower in paper.abstract.lower() or
-                any(query_lower in area.lower() for area in paper.subject_areas) or
-                any(query_lower in author.name.lower() for author in paper.authors)):
-                matching_papers.append(paper)
-
-        return matching_papers[:limit]
+        for row in candidates:
+            if len(matching_papers) >= limit:
+                break
+            title, abstract, subject_areas, author_names = self._search_fields[row]
+            if (query_lower in title or
+                query_lower in abstract or
+                any(query_lower in area for area in subject_areas) or
+                any(query_lower in name for name in author_names)):
+                matching_papers.append(all_papers[row])
+
+        return matching_papers
@@ -1,45 +1,159 @@
+import os
 import numpy as np
-from sklearn.metrics.pairwise import cosine_similarity
-from sklearn.cluster import KMeans
+from sklearn.cluster import KMeans, MiniBatchKMeans
 from sklearn.manifold import TSNE
+from threadpoolctl import threadpool_limits
 from typing import Dict, List, Tuple, Optional
 from ..models.paper import Paper, PaperSimilarity, GraphNode, GraphEdge, GraphData
 from .data_loader import DataLoader
 
 
+# Rows per tile when computing pairwise similarities for the graph
+EDGE_BLOCK_SIZE = 256
+
+# From this many papers on, clustering fits on mini-batches instead of every row
+MINIBATCH_KMEANS_MIN_PAPERS = 2000
+MINIBATCH_KMEANS_BATCH_SIZE = 4096
+
+
+def numeric_threads() -> int:
+    """Threads for BLAS/OpenMP math: NUMERIC_THREADS, or the cores split between uvicorn workers"""
+    workers = int(os.getenv("WEB_CONCURRENCY", "1"))
+    return int(os.getenv("NUMERIC_THREADS", str(max(1, (os.cpu_count() or 1) // workers))))
+
+
+def openmp_thread_limits() -> threadpool_limits:
+    """Cap OpenMP threads on the calling thread for the duration of a fit
+
+    OpenMP limits are per thread, so a cap set at startup does not reach the
+    threadpool workers that run clustering and embedding fits.
+    """
+    return threadpool_limits(limits=numeric_threads(), user_api='openmp')
+
+
+def _emit_edges(normalized: np.ndarray, threshold: float, max_edges: int, block_size: int = EDGE_BLOCK_SIZE) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Pick the strongest pairs above threshold from L2-normalized rows as (sources, targets, scores)
+
+    Similarities are computed one block of rows at a time against the rows at or
+    after the block start, so only the upper triangle is multiplied and memory
+    stays at block_size x N instead of N x N.
+    """
+    sources, targets, scores = [], [], []
+    for start in range(0, len(normalized), block_size):
+        block = normalized[start:start + block_size] @ normalized[start:].T
+        # Block row r is paper start + r and column c is paper start + c, so
+        # the strict upper triangle of the block is exactly the pairs i < j
+        rows, cols = np.nonzero(np.triu(block > threshold, k=1))
+        sources.append(rows + start)
+        targets.append(cols + start)
+        scores.append(block[rows, cols])
+
+    if not sources:
+        return np.empty(0, dtype=np.intp), np.empty(0, dtype=np.intp), np.empty(0, dtype=normalized.dtype)
+
+    sources, targets, scores = np.concatenate(sources), np.concatenate(targets), np.concatenate(scores)
+    # Only the strongest max_edges pairs are sorted; ties keep row-major order
+    order = _top_k_rows(scores, max_edges)
+    return sources[order], targets[order], scores[order]
+
+
+def _top_k_rows(scores: np.ndarray, k: int) -> np.ndarray:
+    """Rows of the k highest scores, best first, with ties kept in row order
+
+    argpartition finds the k-th best score in linear time, so only the rows
+    scoring at least that much are sorted rather than every row.
+    """
+    if k <= 0:
+        return np.empty(0, dtype=np.intp)
+    if k >= len(scores):
+        return np.argsort(-scores, kind="stable")
+    kth_score = scores[np.argpartition(-scores, k - 1)[k - 1]]
+    candidates = np.flatnonzero(scores >= kth_score)
+    return candidates[np.argsort(-scores[candidates], kind="stable")[:k]]
+
+
+def _kmeans(n_clusters: int, n_samples: int):
+    """KMeans for small inputs, MiniBatchKMeans once full passes over the data get costly"""
+    if n_samples >= MINIBATCH_KMEANS_MIN_PAPERS:
+        return MiniBatchKMeans(
+            n_clusters=n_clusters,
+            batch_size=min(MINIBATCH_KMEANS_BATCH_SIZE, n_samples),
+            n_init=3,
+            random_state=42
+        )
+    return KMeans(n_clusters=n_clusters, random_state=42)
+
+
 class SimilarityService:
     def __init__(self, data_loader: DataLoader):
         self.data_loader = data_loader
         self._all_embeddings: Optional[Dict[str, np.ndarray]] = None
+        # Embedding index, built once on first use: paper IDs, their embeddings
+        # as one contiguous float32 matrix, the same rows L2-normalized and an
+        # ID -> row lookup
+        self._index_ids: Optional[List[str]] = None
+        self._index_embeddings: Optional[np.ndarray] = None
+        self._index_matrix: Optional[np.ndarray] = None
+        self._index_rows: Dict[str, int] = {}
 
     def _get_embeddings(self) -> Dict[str, np.ndarray]:
-        """Lazy load all embeddings"""
+        """Embeddings by paper ID, as views into the index's embedding matrix"""
         if self._all_embeddings is None:
-            self._all_embeddings = self.data_loader.get_all_embeddings()
+            paper_ids, _ = self._get_index()
+            self._all_embeddings = dict(zip(paper_ids, self._index_embeddings))
         return self._all_embeddings
 
+    def _get_index(self) -> Tuple[List[str], np.ndarray]:
+        """Lazy build the normalized embedding matrix so cosine similarity is a dot product"""
+        if self._index_matrix is None:
+            paper_ids, embeddings = self.data_loader.get_embedding_matrix()
+            matrix = embeddings.copy()
+            if matrix.ndim == 2:
+                norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+                matrix /= np.where(norms == 0, 1, norms)
+            self._index_rows = {pid: i for i, pid in enumerate(paper_ids)}
+            self._index_ids = paper_ids
+            self._index_embeddings = embeddings
+            self._index_matrix = matrix
+        return self._index_ids, self._index_matrix
+
+    def get_embeddings_matrix(self, paper_ids: List[str]) -> Tuple[List[str], np.ndarray]:
+        """The given papers that have an embedding, with their embeddings stacked in that order"""
+        self._get_index()
+        found_ids = [pid for pid in paper_ids if pid in self._index_rows]
+        if found_ids == self._index_ids:
+            return found_ids, self._index_embeddings
+        return found_ids, self._index_embeddings[[self._index_rows[pid] for pid in found_ids]]
+
     def find_similar_papers(self, paper_id: str, limit: int = 10) -> List[PaperSimilarity]:
         """Find papers similar to the given paper using cosine similarity"""
-        target_embedding = self.data_loader.get_embedding_by_id(paper_id)
-        if target_embedding is None:
+        paper_ids, matrix = self._get_index()
+        own_row = self._index_rows.get(paper_id)
+        if own_row is not None:
+            # Indexed papers are queried with their already normalized row
+            query = matrix[own_row]
+        else:
+            target_embedding = self.data_loader.get_embedding_by_id(paper_id)
+            if target_embedding is None or not paper_ids:
+                return []
+            norm = np.linalg.norm(target_embedding)
+            query = (target_embedding / (norm if norm else 1)).astype(np.float32)
+
+        # One matrix-vector product scores the query against every paper
+        scores = matrix @ query
+        if own_row is not None:
+            scores[own_row] = -np.inf
+
+        k = min(limit, len(paper_ids) - (own_row is not None))
+        if k <= 0:
             return []
 
-        all_embeddings = self._get_embeddings()
-        similarities = []
-
-        for other_id, other_embedding in all_embeddings.items():
-            if other_id == paper_id:
-                continue
-
-            similarity = cosine_similarity([target_embedding], [other_embedding])[0][0]
-            similarities.append((other_id, float(similarity)))
-
-        # Sort by similarity descending
-        similarities.sort(key=lambda x: x[1], reverse=True)
+        top_rows = _top_k_rows(scores, k)
 
         # Get top similar papers with their details
         result = []
-        for other_id, score in similarities[:limit]:
+        for row in top_rows:
+            other_id, score = paper_ids[row], float(scores[row])
             paper = self.data_loader.get_paper_by_id(other_id)
             if paper:
                 result.append(PaperSimilarity(
@@ -83,31 +197,23 @@ class SimilarityService:
                 nodes.append(node)
 
         # Calculate similarity matrix only for selected papers
-        selected_embeddings = {pid: all_embeddings[pid] for pid in paper_ids if pid in all_embeddings}
-        embeddings_matrix = np.array([selected_embeddings[pid] for pid in paper_ids])
-        similarity_matrix = cosine_similarity(embeddings_matrix)
+        _, embeddings_matrix = self.get_embeddings_matrix(paper_ids)
+        _, index_matrix = self._get_index()
+        normalized = index_matrix[[self._index_rows[pid] for pid in paper_ids]]
 
-        # Create edges based on similarity threshold
-        edges = []
-        for i, source_id in enumerate(paper_ids):
-            for j, target_id in enumerate(paper_ids):
-                if i < j and similarity_matrix[i][j] > similarity_threshold:
-                    edge = GraphEdge(
-                        source=source_id,
-                        target=target_id,
-                        similarity=float(similarity_matrix[i][j])
-                    )
-                    edges.append(edge)
-
-        # Limit edges for performance
-        edges.sort(key=lambda x: x.similarity, reverse=True)
-        edges = edges[:max_edges]
+        # Create edges based on similarity threshold, limited for performance
+        sources, targets, scores = _emit_edges(normalized, similarity_threshold, max_edges)
+        edges = [
+            GraphEdge(source=paper_ids[i], target=paper_ids[j], similarity=score)
+            for i, j, score in zip(sources.tolist(), targets.tolist(), scores.tolist())
+        ]
 
         # Perform clustering
         n_clusters = min(10, len(paper_ids) // 20)  # Adaptive cluster count
         if n_clusters > 1:
-            kmeans = KMeans(n_clusters=n_clusters, random_state=42)
-            cluster_labels = kmeans.fit_predict(embeddings_matrix)
+            kmeans = _kmeans(n_clusters, len(embeddings_matrix))
+            with openmp_thread_limits():
+                cluster_labels = kmeans.fit_predict(embeddings_matrix)
 
             # Add cluster information to nodes
             for i, node in enumerate(nodes):
@@ -137,13 +243,14 @@ class SimilarityService:
         if len(paper_ids) < n_clusters:
             n_clusters = len(paper_ids)
 
-        embeddings_matrix = np.array([all_embeddings[pid] for pid in paper_ids])
+        _, embeddings_matrix = self.get_embeddings_matrix(paper_ids)
 
         if embeddings_matrix.size == 0:
             return {}
 
-        kmeans = KMeans(n_clusters=n_clusters, random_state=42)
-        cluster_labels = kmeans.fit_predict(embeddings_matrix)
+        kmeans = _kmeans(n_clusters, len(embeddings_matrix))
+        with openmp_thread_limits():
+            cluster_labels = kmeans.fit_predict(embeddings_matrix)
 
         clusters = {}
         for i, paper_id in enumerate(paper_ids):
@@ -187,8 +294,7 @@ class SimilarityService:
                 nodes.append(node)
 
         # Calculate similarity-based coordinates using MDS
-        selected_embeddings = {pid: all_embeddings[pid] for pid in paper_ids if pid in all_embeddings}
-        embeddings_matrix = np.array([selected_embeddings[pid] for pid in paper_ids])
+        _, embeddings_matrix = self.get_embeddings_matrix(paper_ids)
 
         # Use MDS (Multidimensional Scaling) to position nodes based on similarity distances
         from sklearn.manifold import MDS
@@ -205,7 +311,8 @@ class SimilarityService:
             max_iter=500,
             eps=1e-6  # Better convergence
         )
-        coords = mds.fit_transform(distance_matrix)
+        with openmp_thread_limits():
+            coords = mds.fit_transform(distance_matrix)
 
         # Add coordinates to nodes with better scaling
         if coords is not None:
@@ -232,7 +339,8 @@ class SimilarityService:
                 metric='cosine',
                 linkage='average'
             )
-            cluster_labels = clustering.fit_predict(embeddings_matrix)
+            with openmp_thread_limits():
+                cluster_labels = clustering.fit_predict(embeddings_matrix)
 
             # Add cluster information to nodes
             for i, node in enumerate(nodes):
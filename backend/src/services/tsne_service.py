@@ -6,7 +6,7 @@ from typing import Dict, List, Optional, Tuple
 from functools import lru_cache
 from ..models.paper import Paper
 from ..services.data_loader import DataLoader
-from ..services.similarity import SimilarityService
+from ..services.similarity import SimilarityService, openmp_thread_limits
 
 logger = logging.getLogger(__name__)
 
@@ -14,9 +14,10 @@ logger = logging.getLogger(__name__)
 class TSNEService:
     """Service for handling t-SNE coordinates and similarity analysis with memoization"""
 
-    def __init__(self, data_loader: DataLoader):
+    def __init__(self, data_loader: DataLoader, similarity_service: Optional[SimilarityService] = None):
         self.data_loader = data_loader
-        self.similarity_service = SimilarityService(data_loader)
+        # Reuse the caller's SimilarityService so embeddings are only loaded once
+        self.similarity_service = similarity_service or SimilarityService(data_loader)
         self.cache_dir = Path(__file__).parent.parent / "data" / "cache"
 
         # Try to create cache directory, fall back to temp if permission denied
@@ -73,35 +74,27 @@ class TSNEService:
             all_papers = self.data_loader.get_all_papers()
             logger.info(f"Found {len(all_papers)} papers")
 
-            # Load embeddings
-            embeddings = []
-            paper_ids = []
-
-            for i, paper in enumerate(all_papers):
-                if i % 100 == 0:
-                    logger.info(f"Loading embeddings: {i}/{len(all_papers)}")
-
-                embedding = self.data_loader.get_embedding_by_id(paper.id)
-                if embedding is not None:
-                    embeddings.append(embedding)
-                    paper_ids.append(paper.id)
+            # Embeddings of the papers that have one, as rows of the shared matrix
+            paper_ids, embeddings_array = self.similarity_service.get_embeddings_matrix(
+                [paper.id for paper in all_papers]
+            )
 
-            if not embeddings:
+            if not paper_ids:
                 logger.warning("No embeddings found, using fallback coordinates")
                 return self._generate_fallback_coordinates()
 
-            logger.info(f"Loaded {len(embeddings)} embeddings, applying t-SNE...")
-            embeddings_array = np.array(embeddings)
+            logger.info(f"Loaded {len(paper_ids)} embeddings, applying t-SNE...")
 
             # Apply t-SNE directly to embeddings
             tsne = TSNE(
                 n_components=2,
-                perplexity=min(30, len(embeddings) - 1),
+                perplexity=min(30, len(paper_ids) - 1),
                 random_state=42,
                 max_iter=1000,
                 verbose=1
             )
-            tsne_coords = tsne.fit_transform(embeddings_array)
+            with openmp_thread_limits():
+                tsne_coords = tsne.fit_transform(embeddings_array)
 
             logger.info("t-SNE completed, creating coordinate data...")
 
@@ -5,7 +5,10 @@ Tests the parsing of HTML content from MICCAI into structured Paper entities.
 These tests will fail initially (TDD) and pass once the implementation works.
 """
 
+import hashlib
 import json
+import random
+import re
 import tempfile
 from pathlib import Path
 
@@ -133,6 +136,26 @@ class TestPaperParserIntegration:
             assert all(isinstance(author, Author) for author in authors)
             assert all(author.name for author in authors)
 
+    def test_parse_authors_matches_sequential_split(self, parser):
+        """The single-pass split must match splitting on each delimiter in turn."""
+        passes = [re.compile(p, re.IGNORECASE) for p in (r',\s*', r';\s*', r'\s+and\s+', r'\s*\|\s*')]
+
+        def sequential_names(authors_text):
+            parts = [authors_text]
+            for pattern in passes:
+                parts = [piece for part in parts for piece in pattern.split(part)]
+            names = [' '.join(part.split()) for part in parts]
+            return [name for name in names if name] or ["Unknown Author"]
+
+        tokens = ['Ann', 'Bo', 'and', 'AND', 'andrew', ',', ';', '|', ' ', '  ', '\t']
+        rng = random.Random(0)
+        cases = ["A | B | and C", "A |and B", "A and | B", "A, and B", "A | and"]
+        cases += [''.join(rng.choice(tokens) for _ in range(rng.randint(1, 12))) for _ in range(5000)]
+
+        for authors_text in cases:
+            names = [author.name for author in parser.parse_authors(authors_text)]
+            assert names == sequential_names(authors_text), f"Failed for: {authors_text!r}"
+
     def test_parse_authors_with_emails(self, parser):
         """Test author parsing with email addresses."""
         authors_text = "John Smith (john@example.com), Jane Doe (jane.doe@university.edu)"
@@ -277,6 +300,24 @@ class TestPaperParserIntegration:
             # Clean up
             Path(temp_path).unlink(missing_ok=True)
 
+    def test_iter_json_array_streams_items(self, sample_raw_papers_json):
+        """Test that raw papers are read item by item across chunk boundaries."""
+        from src.lib.paper_parser import _iter_json_array
+
+        raw = sample_raw_papers_json + [1.25, None, "text, with ] and [", {"nested": [1, 2]}]
+        content = json.dumps(raw, indent=2)
+
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
+            f.write(content)
+            temp_path = f.name
+
+        try:
+            for chunk_size in (1, 7, 1 << 16):
+                with open(temp_path, 'r', encoding='utf-8') as f:
+                    assert list(_iter_json_array(f, chunk_size=chunk_size)) == raw
+        finally:
+            Path(temp_path).unlink(missing_ok=True)
+
     def test_save_parsed_papers(self, parser):
         """Test saving parsed papers to JSON file."""
         # Create sample papers
@@ -323,6 +364,25 @@ class TestPaperParserIntegration:
             # Clean up
             Path(temp_path).unlink(missing_ok=True)
 
+    def test_save_parsed_papers_ndjson(self, parser, tmp_path):
+        """Test saving parsed papers as JSON Lines."""
+        papers = [
+            Paper(
+                id=f"test-paper-{i}",
+                title=f"Test Paper {i}",
+                abstract="This is a test abstract with sufficient length for validation.",
+                authors=[Author(name="Test Author")],
+                subject_areas=["Computer Vision"]
+            )
+            for i in range(3)
+        ]
+        output_path = tmp_path / "papers.jsonl"
+
+        parser.save_parsed_papers(papers, str(output_path), ndjson=True)
+
+        lines = output_path.read_text(encoding='utf-8').splitlines()
+        assert [json.loads(line)['id'] for line in lines] == ["test-paper-0", "test-paper-1", "test-paper-2"]
+
     def test_generate_paper_id(self, parser):
         """Test paper ID generation from different inputs."""
         test_cases = [
@@ -343,6 +403,14 @@ class TestPaperParserIntegration:
                 # Should be based on title
                 assert any(word in paper_id.lower() for word in title.lower().split() if word)
 
+    def test_generate_paper_id_fallback_is_stable(self, parser):
+        """Test that fallback IDs do not depend on the process hash seed."""
+        url = "https://example.com/random url/"
+        paper_id = parser._generate_paper_id("!!!", url)
+
+        assert paper_id == parser._generate_paper_id("!!!", url)
+        assert paper_id == "paper-" + hashlib.blake2b(url.encode('utf-8'), digest_size=3).hexdigest()
+
     def test_cli_interface_exists(self):
         """Test that the CLI interface is properly defined."""
         from src.lib.paper_parser import main
@@ -0,0 +1,141 @@
+"""
+Integration tests for the parallel MICCAI scraper's page parsing.
+
+Responses are built locally, so these tests do not touch the network.
+"""
+
+import io
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+import requests
+from bs4 import BeautifulSoup
+from urllib3.response import HTTPResponse
+
+from src.lib import miccai_parallel_scraper
+from src.lib.miccai_parallel_scraper import MICCAIParallelScraper, _DetailPageCollector
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+
+
+def make_response(body: bytes, content_type: str = 'text/html') -> requests.Response:
+    """A streamed requests.Response serving body, as session.get(..., stream=True) returns"""
+    response = requests.Response()
+    response.status_code = 200
+    response.headers['Content-Type'] = content_type
+    response.raw = HTTPResponse(body=io.BytesIO(body), preload_content=False)
+    response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+    return response
+
+
+class TestParallelScraperParsing:
+    """Parsing of the MICCAI index page by the parallel scraper."""
+
+    @pytest.fixture
+    def scraper(self):
+        """Create a scraper instance for testing."""
+        return MICCAIParallelScraper(max_workers=1, request_delay=0)
+
+    @pytest.fixture
+    def index_page(self):
+        """Index page with a non-ASCII author and no <meta charset>."""
+        return """
+        <html><body><ul>
+            <li>
+                <b>Robust Segmentation of Cardiac MRI with Uncertainty</b>
+                <a href="/miccai-2025/tags#José Müller">José Müller</a>
+            </li>
+        </ul></body></html>
+        """.encode('utf-8')
+
+    def test_index_page_without_charset_decodes_as_utf8(self, scraper, index_page):
+        with patch.object(scraper.session, 'get', return_value=make_response(index_page)):
+            papers = scraper.extract_all_papers_metadata()
+
+        assert len(papers) == 1
+        assert papers[0]['authors'] == ['José Müller']
+
+    def test_index_page_honors_declared_charset(self, scraper, index_page):
+        body = index_page.decode('utf-8').encode('latin-1')
+        response = make_response(body, content_type='text/html; charset=ISO-8859-1')
+        with patch.object(scraper.session, 'get', return_value=response):
+            papers = scraper.extract_all_papers_metadata()
+
+        assert papers[0]['authors'] == ['José Müller']
+
+
+class TestDetailPageParsing:
+    """The streaming detail page parser must agree with the BeautifulSoup extraction."""
+
+    @pytest.fixture
+    def scraper(self):
+        """Create a scraper instance for testing."""
+        return MICCAIParallelScraper(max_workers=1, request_delay=0)
+
+    @pytest.fixture
+    def detail_page(self):
+        """A saved MICCAI paper page, longer than one streaming chunk."""
+        return (FIXTURES_DIR / "miccai_detail_page.html").read_bytes()
+
+    @pytest.fixture
+    def container_abstract_page(self, detail_page):
+        """The same page with its abstract in a container instead of under a heading."""
+        html = detail_page.decode('utf-8')
+        start = html.index('<h2 id="abstract">')
+        end = html.index('<h2 id="links')
+        paragraphs = html[html.index('<p>', start):end]
+        return (html[:start] + f'<div class="abstract">{paragraphs}</div>\n' + html[end:]).encode('utf-8')
+
+    @staticmethod
+    def soup_extraction(scraper, page: bytes):
+        """Topics and abstract as extracted from a BeautifulSoup tree of the whole page"""
+        soup = BeautifulSoup(page, 'lxml')
+        return scraper._extract_detailed_topics(soup.get_text()), scraper._extract_abstract(soup)
+
+    def fetch_details(self, scraper, page: bytes, chunk_size: int) -> dict:
+        paper_meta = {
+            'paper_id': '0123',
+            'paper_slug': '0123-Paper0123',
+            'title': 'Uncertainty-Aware Diffusion for Cardiac MRI Segmentation',
+            'authors': ['José Müller', 'Zoë Åberg', 'Wei Zhang'],
+            'pdf_url': 'https://papers.miccai.org/miccai-2025/paper/0123_paper.pdf',
+            'topics': [],
+        }
+        with patch.object(miccai_parallel_scraper, 'DETAIL_CHUNK_SIZE', chunk_size), \
+                patch.object(scraper.session, 'get', return_value=make_response(page)):
+            return scraper.fetch_paper_details(dict(paper_meta), worker_id=0)
+
+    def test_fixture_exercises_streaming(self, scraper, detail_page):
+        topics, abstract = self.soup_extraction(scraper, detail_page)
+        assert len(detail_page) > miccai_parallel_scraper.DETAIL_CHUNK_SIZE
+        assert topics == ['Cardiac', 'Segmentation', 'Uncertainty Quantification']
+        assert abstract.startswith('Accurate segmentation') and '41% —' in abstract
+
+    # Tiny chunks split tags, entities and multi-byte characters across feeds
+    @pytest.mark.parametrize("chunk_size", [1, 7, 512, 8192, 1 << 20])
+    def test_heading_abstract_matches_soup(self, scraper, detail_page, chunk_size):
+        topics, abstract = self.soup_extraction(scraper, detail_page)
+        details = self.fetch_details(scraper, detail_page, chunk_size)
+
+        assert details['topics'] == topics
+        assert details['abstract'] == abstract
+        assert details['authors'] == ['José Müller', 'Zoë Åberg', 'Wei Zhang']
+        assert details['pdf_url'] == 'https://papers.miccai.org/miccai-2025/paper/0123_paper.pdf'
+
+    @pytest.mark.parametrize("chunk_size", [7, 8192])
+    def test_container_abstract_falls_back_to_soup(self, scraper, container_abstract_page, chunk_size):
+        topics, abstract = self.soup_extraction(scraper, container_abstract_page)
+        details = self.fetch_details(scraper, container_abstract_page, chunk_size)
+
+        assert abstract is not None
+        assert details['topics'] == topics
+        assert details['abstract'] == abstract
+
+    def test_collector_text_skips_script_and_style(self, detail_page):
+        collector = _DetailPageCollector()
+        parser = miccai_parallel_scraper.etree.HTMLParser(target=collector, encoding='utf-8')
+        parser.feed(detail_page)
+        parser.close()
+
+        assert collector.text == BeautifulSoup(detail_page, 'lxml').get_text()
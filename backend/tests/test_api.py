@@ -1,23 +1,32 @@
+import gc
+import weakref
 import pytest
+from unittest.mock import Mock
 from fastapi.testclient import TestClient
 from main import app
+from src.api.papers import _cached_json_response, _cached_payload, _response_cache
 
-client = TestClient(app)
 
+@pytest.fixture(scope="module")
+def client():
+    # Entering the client runs the app lifespan, which builds the services
+    with TestClient(app) as test_client:
+        yield test_client
 
-def test_root_endpoint():
+
+def test_root_endpoint(client):
     response = client.get("/")
     assert response.status_code == 200
     assert "message" in response.json()
 
 
-def test_health_endpoint():
+def test_health_endpoint(client):
     response = client.get("/health")
     assert response.status_code == 200
     assert response.json() == {"status": "healthy"}
 
 
-def test_papers_endpoint():
+def test_papers_endpoint(client):
     response = client.get("/api/papers/")
     assert response.status_code == 200
     data = response.json()
@@ -26,26 +35,35 @@ def test_papers_endpoint():
     assert len(data) > 0
 
 
-def test_papers_pagination():
+def test_papers_pagination(client):
     response = client.get("/api/papers/", params={"limit": 5, "offset": 0})
     assert response.status_code == 200
     data = response.json()
     assert len(data) <= 5
+    assert int(response.headers["x-total-count"]) >= len(data)
 
 
-def test_search_papers():
+def test_search_papers(client):
     response = client.get("/api/papers/search", params={"q": "medical"})
     assert response.status_code == 200
     data = response.json()
     assert isinstance(data, list)
 
 
-def test_search_papers_empty_query():
+def test_search_results_cached_per_data_loader(client):
+    first = client.get("/api/papers/search", params={"q": "Medical", "limit": 5})
+    second = client.get("/api/papers/search", params={"q": "medical", "limit": 5})
+    assert first.content == second.content
+    # Cached under the app's DataLoader, so a replaced loader takes its entries with it
+    assert ("medical", 5) in _response_cache[app.state.data_loader]["search"]
+
+
+def test_search_papers_empty_query(client):
     response = client.get("/api/papers/search", params={"q": ""})
     assert response.status_code == 422  # Validation error
 
 
-def test_get_paper_by_id():
+def test_get_paper_by_id(client):
     # First get a paper ID from the papers list
     papers_response = client.get("/api/papers/", params={"limit": 1})
     assert papers_response.status_code == 200
@@ -62,12 +80,12 @@ def test_get_paper_by_id():
         assert "authors" in data
 
 
-def test_get_nonexistent_paper():
+def test_get_nonexistent_paper(client):
     response = client.get("/api/papers/nonexistent-id")
     assert response.status_code == 404
 
 
-def test_similar_papers():
+def test_similar_papers(client):
     # First get a paper ID
     papers_response = client.get("/api/papers/", params={"limit": 1})
     papers = papers_response.json()
@@ -80,12 +98,12 @@ def test_similar_papers():
         assert isinstance(data, list)
 
 
-def test_similar_papers_nonexistent():
+def test_similar_papers_nonexistent(client):
     response = client.get("/api/papers/nonexistent-id/similar")
     assert response.status_code == 404
 
 
-def test_dataset_stats():
+def test_dataset_stats(client):
     response = client.get("/api/papers/stats/summary")
     assert response.status_code == 200
     data = response.json()
@@ -96,7 +114,7 @@ def test_dataset_stats():
     assert isinstance(data["total_authors"], int)
 
 
-def test_graph_data():
+def test_graph_data(client):
     response = client.get("/api/papers/graph/data")
     assert response.status_code == 200
     data = response.json()
@@ -106,7 +124,7 @@ def test_graph_data():
     assert isinstance(data["edges"], list)
 
 
-def test_graph_data_with_params():
+def test_graph_data_with_params(client):
     response = client.get("/api/papers/graph/data", params={
         "similarity_threshold": 0.8,
         "max_edges": 100
@@ -116,7 +134,16 @@ def test_graph_data_with_params():
     assert len(data["edges"]) <= 100
 
 
-def test_paper_clusters():
+def test_graph_data_respects_exact_threshold(client):
+    response = client.get("/api/papers/graph/data", params={
+        "similarity_threshold": 0.705,
+        "max_edges": 5000
+    })
+    assert response.status_code == 200
+    assert all(edge["similarity"] > 0.705 for edge in response.json()["edges"])
+
+
+def test_paper_clusters(client):
     response = client.get("/api/papers/clusters/")
     assert response.status_code == 200
     data = response.json()
@@ -128,9 +155,87 @@ def test_paper_clusters():
         assert "size" in data[cluster_id]
 
 
-def test_paper_clusters_with_params():
+def test_paper_clusters_with_params(client):
     response = client.get("/api/papers/clusters/", params={"n_clusters": 5})
     assert response.status_code == 200
     data = response.json()
     # Should have at most 5 clusters
-    assert len(data) <= 5
\ No newline at end of file
+    assert len(data) <= 5
+
+def test_dataset_stats_etag(client):
+    response = client.get("/api/papers/stats/summary")
+    assert response.status_code == 200
+    etag = response.headers["etag"]
+
+    cached = client.get("/api/papers/stats/summary", headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.headers["etag"] == etag
+
+
+def test_dataset_stats_etag_header_forms(client):
+    etag = client.get("/api/papers/stats/summary").headers["etag"]
+    strong_form = etag.removeprefix("W/")
+
+    for if_none_match in (f'"other", {etag}', strong_form, "*"):
+        cached = client.get("/api/papers/stats/summary", headers={"If-None-Match": if_none_match})
+        assert cached.status_code == 304
+    assert client.get("/api/papers/stats/summary", headers={"If-None-Match": '"other"'}).status_code == 200
+
+
+def test_etag_is_weak_for_gzipped_responses(client):
+    # One validator covers both the plain and the gzip-encoded body
+    plain = client.get("/api/papers/stats/summary", headers={"Accept-Encoding": "identity"})
+    gzipped = client.get("/api/papers/stats/summary", headers={"Accept-Encoding": "gzip"})
+    assert gzipped.headers["content-encoding"] == "gzip"
+    assert plain.headers["etag"].startswith('W/"')
+    assert gzipped.headers["etag"] == plain.headers["etag"]
+
+
+def test_response_cache_is_per_service():
+    request = Mock(headers={})
+    first = _cached_json_response(request, Mock(), "stats-summary", lambda: {"n": 1})
+    second = _cached_json_response(request, Mock(), "stats-summary", lambda: {"n": 2})
+    assert first.body != second.body
+    assert first.headers["etag"] != second.headers["etag"]
+
+
+def test_cached_payload_does_not_keep_service_alive():
+    service = Mock()
+    _cached_payload(service, "graph-data", lambda: {"n": 1}, args=(0.7, 1000, None))
+    service_ref = weakref.ref(service)
+    del service
+    gc.collect()
+    assert service_ref() is None
+
+
+def test_cached_payload_evicts_least_recently_used():
+    service, build = Mock(), Mock(return_value={"n": 1})
+    for args in ("a", "b", "a", "c", "a", "b"):
+        _cached_payload(service, "graph-data", build, args=args, maxsize=2)
+    # "b" was evicted by "c" and rebuilt; "a" stayed cached throughout
+    assert build.call_count == 4
+
+
+def test_large_response_is_gzipped(client):
+    response = client.get("/api/papers/", params={"limit": 50}, headers={"Accept-Encoding": "gzip"})
+    assert response.status_code == 200
+    assert response.headers["content-encoding"] == "gzip"
+
+
+def test_cors_preflight(client):
+    response = client.options("/api/papers/", headers={
+        "Origin": "http://localhost:5173",
+        "Access-Control-Request-Method": "GET",
+    })
+    assert response.status_code == 200
+    assert response.headers["access-control-allow-origin"] == "http://localhost:5173"
+    assert "GET" in response.headers["access-control-allow-methods"]
+
+
+def test_similarity_network_nonexistent(client, monkeypatch):
+    # Unknown papers are rejected before the network build runs
+    build = Mock()
+    monkeypatch.setattr(app.state.tsne_service, "get_similarity_network_data", build)
+    response = client.get("/api/papers/nonexistent-id/similarity-network")
+    assert response.status_code == 404
+    build.assert_not_called()
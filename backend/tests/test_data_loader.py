@@ -1,4 +1,6 @@
+import os
 import pytest
+import numpy as np
 from src.services.data_loader import DataLoader
 from src.models.paper import Paper
 
@@ -100,4 +102,112 @@ def test_search_papers_empty_query():
 def test_search_papers_limit():
     loader = DataLoader()
     results = loader.search_papers("a", limit=5)  # Common letter
-    assert len(results) <= 5
\ No newline at end of file
+    assert len(results) <= 5
+
+def test_get_papers_slice():
+    loader = DataLoader()
+    all_papers = loader.get_all_papers()
+    papers, total = loader.get_papers_slice(offset=2, limit=3)
+    assert total == len(all_papers)
+    assert [p.id for p in papers] == [p.id for p in all_papers[2:5]]
+
+
+def test_get_paper_summaries():
+    loader = DataLoader()
+    summaries = loader.get_paper_summaries()
+    paper = loader.get_all_papers()[0]
+    assert summaries[paper.id] == {
+        "id": paper.id,
+        "title": paper.title,
+        "authors": [a.name for a in paper.authors]
+    }
+
+
+def test_get_papers_slice_as_dicts():
+    loader = DataLoader()
+    papers, total = loader.get_papers_slice(offset=0, limit=2, as_dicts=True)
+    assert total == len(loader.get_all_papers())
+    assert papers == [p.model_dump() for p in loader.get_all_papers()[:2]]
+
+
+def test_preload_uses_snapshot(tmp_path):
+    loader = DataLoader()
+    loader.snapshot_file = tmp_path / "papers.pkl"
+    loader.preload()
+    assert loader.snapshot_file.exists()
+
+    reloaded = DataLoader()
+    reloaded.snapshot_file = loader.snapshot_file
+    reloaded.preload()
+    assert [p.id for p in reloaded.get_all_papers()] == [p.id for p in loader.get_all_papers()]
+    assert reloaded.load_paper_index() == loader.load_paper_index()
+
+def test_snapshot_ignored_after_paper_file_edit(tmp_path):
+    loader = DataLoader()
+    loader.snapshot_file = tmp_path / "papers.pkl"
+    loader.preload()
+    assert loader._load_snapshot() is not None
+
+    newest = loader._newest_paper_mtime()
+    os.utime(loader.snapshot_file, (newest - 10, newest - 10))
+    assert loader._load_snapshot() is None
+
+
+def test_get_embedding_matrix_uses_snapshot(tmp_path):
+    loader = DataLoader()
+    loader.embeddings_snapshot_dir = tmp_path
+    paper_ids, matrix = loader.get_embedding_matrix()
+    assert len(list(tmp_path.glob("embeddings_*.npy"))) == 2
+    assert matrix.dtype == np.float32
+    assert matrix.shape[0] == len(paper_ids)
+
+    reloaded = DataLoader()
+    reloaded.embeddings_snapshot_dir = tmp_path
+    reloaded_ids, reloaded_matrix = reloaded.get_embedding_matrix()
+    assert reloaded_ids == paper_ids
+    assert np.array_equal(reloaded_matrix, matrix)
+    assert not reloaded._embeddings_cache
+
+
+def test_embedding_snapshot_tracks_rewritten_files(tmp_path):
+    loader = DataLoader(data_dir=str(tmp_path))
+    loader.papers_dir.mkdir(parents=True)
+    loader.embeddings_dir.mkdir(parents=True)
+    (loader.papers_dir / "index.json").write_text('{"papers": [{"id": "p1"}]}')
+    embedding_file = loader.embeddings_dir / "p1_embedding.npy"
+    np.save(embedding_file, np.zeros(4, dtype=np.float32))
+    assert np.array_equal(loader.get_embedding_matrix()[1], np.zeros((1, 4)))
+
+    # Re-embedding overwrites the file in place
+    np.save(embedding_file, np.ones(4, dtype=np.float32))
+    os.utime(embedding_file, ns=(0, embedding_file.stat().st_mtime_ns + 10**9))
+    reloaded = DataLoader(data_dir=str(tmp_path))
+    assert np.array_equal(reloaded.get_embedding_matrix()[1], np.ones((1, 4)))
+    assert len(list(loader.embeddings_snapshot_dir.glob("embeddings_*.npy"))) == 2
+
+
+def test_search_papers_matches_full_scan():
+    loader = DataLoader()
+    all_papers = loader.get_all_papers()
+
+    for query in ["segmentation", "seg", "deep learn", "x-ray", "zzzzqq"]:
+        expected = [
+            paper.id for paper in all_papers
+            if query in paper.title.lower() or
+            query in paper.abstract.lower() or
+            any(query in area.lower() for area in paper.subject_areas) or
+            any(query in author.name.lower() for author in paper.authors)
+        ][:20]
+        assert [paper.id for paper in loader.search_papers(query, limit=20)] == expected
+
+
+def test_get_embedding_by_id_loads_npy(tmp_path):
+    loader = DataLoader(data_dir=str(tmp_path))
+    loader.embeddings_dir.mkdir(parents=True)
+    vector = np.arange(4, dtype=np.float32)
+    np.save(loader.embeddings_dir / "p1_embedding.npy", vector)
+
+    embedding = loader.get_embedding_by_id("p1")
+    assert embedding.dtype == np.float32
+    assert np.array_equal(embedding, vector)
+    assert loader.get_embedding_by_id("p1") is embedding
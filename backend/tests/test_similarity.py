@@ -1,7 +1,10 @@
+import threading
 import pytest
 import numpy as np
+from sklearn.cluster import KMeans, MiniBatchKMeans
+from threadpoolctl import threadpool_info
 from src.services.data_loader import DataLoader
-from src.services.similarity import SimilarityService
+from src.services.similarity import SimilarityService, _emit_edges, _top_k_rows, _kmeans, MINIBATCH_KMEANS_MIN_PAPERS, openmp_thread_limits
 from src.models.paper import PaperSimilarity, GraphData
 
 
@@ -108,4 +111,50 @@ def test_clustering_with_insufficient_data():
     assert len(clusters) == 0
 
     # Restore original method
-    similarity_service._get_embeddings = original_get_embeddings
\ No newline at end of file
+    similarity_service._get_embeddings = original_get_embeddings
+
+def test_emit_edges_matches_full_matrix():
+    rng = np.random.default_rng(0)
+    normalized = rng.normal(size=(50, 8)).astype(np.float32)
+    normalized /= np.linalg.norm(normalized, axis=1, keepdims=True)
+
+    # Small blocks so the tiling crosses several block boundaries
+    sources, targets, scores = _emit_edges(normalized, threshold=0.2, max_edges=40, block_size=7)
+
+    full = normalized @ normalized.T
+    expected = sorted(
+        ((i, j) for i in range(50) for j in range(i + 1, 50) if full[i, j] > 0.2),
+        key=lambda pair: -full[pair]
+    )[:40]
+    assert list(zip(sources.tolist(), targets.tolist())) == expected
+    assert np.allclose(scores, [full[pair] for pair in expected])
+
+
+def test_top_k_rows_matches_full_sort():
+    rng = np.random.default_rng(0)
+    scores = rng.integers(0, 5, size=200).astype(np.float32)
+    for k in (1, 7, 50, 200):
+        expected = np.argsort(-scores, kind="stable")[:k]
+        assert np.array_equal(_top_k_rows(scores, k), expected)
+
+
+def test_kmeans_switches_to_minibatch_for_large_inputs():
+    assert type(_kmeans(5, MINIBATCH_KMEANS_MIN_PAPERS - 1)) is KMeans
+    assert isinstance(_kmeans(5, MINIBATCH_KMEANS_MIN_PAPERS), MiniBatchKMeans)
+
+
+def test_openmp_thread_limits_apply_in_worker_threads(monkeypatch):
+    if not any(info['user_api'] == 'openmp' for info in threadpool_info()):
+        pytest.skip("no OpenMP runtime loaded")
+    monkeypatch.setenv("NUMERIC_THREADS", "3")
+
+    # Fits run in threadpool workers, where a limit set on another thread does not apply
+    seen = []
+    def fit():
+        with openmp_thread_limits():
+            seen.extend(info['num_threads'] for info in threadpool_info() if info['user_api'] == 'openmp')
+    worker = threading.Thread(target=fit)
+    worker.start()
+    worker.join()
+
+    assert seen and all(n == 3 for n in seen)